@@ -3,11 +3,35 @@
 
 # src/binding.py
 
+import hashlib
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+
 from src.register import Register
-from src.constants import BND_DOMAIN_TAG
-from src.hashing import generate
-from src.bls12381 import rng, scale, g1_point, to_int, from_int, curve_order, combine
-from src.files import save_json
+from src.constants import BND_DOMAIN_TAG, BND_DOMAIN_TAG_B
+from src.hashing import generate, transcript
+from src.bls12381 import (
+    rng,
+    g1_point_b,
+    scale_b,
+    combine_b,
+    to_int,
+    from_scalar,
+    g1_identity,
+    curve_order,
+)
+from src.files import constr_bytes_json, save_string
+
+
+@lru_cache(maxsize=16)
+def _register_transcript(g: str, u: str) -> hashlib.blake2b:
+    """
+    Hasher primed with the `BND_DOMAIN_TAG || g || u` prefix of a register.
+
+    The prefix is the same for every proof issued against one register, so
+    it is absorbed once and copied per proof.
+    """
+    return transcript(BND_DOMAIN_TAG_B, bytes.fromhex(g + u))
 
 
 def fiat_shamir_heuristic(
@@ -25,7 +49,7 @@ def fiat_shamir_heuristic(
     challenge scalar `c` (as a hex string), using domain separation via
     `BND_DOMAIN_TAG`.
 
-    Transcript layout (concatenated as strings, in order):
+    Transcript layout (hex strings joined, then hashed as bytes, in order):
         BND_DOMAIN_TAG || g || u || t1b || t2b || r1b || r2b || token_name
 
     Notes:
@@ -33,7 +57,7 @@ def fiat_shamir_heuristic(
       group elements used by the protocol. If either is `None`, it is treated
       as the empty string, which changes the transcript and therefore the
       challenge.
-    - This function returns the hash output as produced by `generate(...)`.
+    - This function returns the hash output as a blake2b_224 hex digest.
       Converting it to an integer challenge modulo the curve order is done
       by `to_int(...)` at the call site.
 
@@ -51,10 +75,15 @@ def fiat_shamir_heuristic(
         A hex string hash digest representing the Fiat–Shamir challenge material.
         (Commonly interpreted as an integer scalar via `to_int`.)
     """
-    g = register.g if register.g is not None else ""
-    u = register.u if register.u is not None else ""
-
-    return generate(BND_DOMAIN_TAG + g + u + t1b + t2b + r1b + r2b + token_name)
+    g, u = register.g or "", register.u or ""
+    # fields are hex fragments of one transcript, so each tail is decoded
+    # joined; only a whole-byte `g || u` can be served from the cached prefix
+    tail = t1b + t2b + r1b + r2b + token_name
+    if len(g + u) % 2:
+        return generate(BND_DOMAIN_TAG + g + u + tail)
+    hasher = _register_transcript(g, u).copy()
+    hasher.update(bytes.fromhex(tail))
+    return hasher.hexdigest()
 
 
 def binding_proof(
@@ -75,7 +104,7 @@ def binding_proof(
         za = alpha + c * a
 
     Output format:
-    - `za` and `zr` are returned as hex strings via `from_int`.
+    - `za` and `zr` are returned as 32-byte hex strings via `from_scalar`.
     - `t1b` and `t2b` are returned in the same serialized form produced by
       `scale/combine` (typically a G1 encoding).
 
@@ -99,23 +128,66 @@ def binding_proof(
     Security notes:
     - `rng()` must be cryptographically secure and must sample uniformly from
       the scalar field (or a distribution compatible with your security model).
-    - Treating `register.u` as empty string when `None` will change `t2` (since
-      `scale(u, rho)` will effectively use an empty input); ensure `u` is always
-      set in normal operation.
+    - A missing (`None` or empty) `register.u` is treated as the G1 identity,
+      so `t2 = [alpha] * G`; ensure `u` is always set in normal operation.
     """
     rho = rng()
     alpha = rng()
 
-    u = register.u if register.u is not None else ""
+    u = register.u or ""
 
-    t1b = scale(g1_point(1), rho)
-    t2b = combine(scale(g1_point(1), alpha), scale(u, rho))
+    # stay in raw bytes between group operations; hex only at the boundary
+    t1b = g1_point_b(rho).hex()
+    if not u or u == g1_identity:
+        # [rho] * O = O, so t2 is just [alpha] * G
+        t2b = g1_point_b(alpha).hex()
+    else:
+        t2b = combine_b(g1_point_b(alpha), scale_b(bytes.fromhex(u), rho)).hex()
 
     c = to_int(fiat_shamir_heuristic(register, t1b, t2b, r1b, r2b, token_name))
     zrb = (rho + c * r) % curve_order
     zab = (alpha + c * a) % curve_order
 
-    return from_int(zab), from_int(zrb), t1b, t2b
+    return from_scalar(zab), from_scalar(zrb), t1b, t2b
+
+
+def binding_proofs_batch(
+    items: list[tuple[int, int, str, str]],
+    register: Register,
+    token_name: str,
+    max_workers: int | None = None,
+) -> list[tuple[str, str, str, str]]:
+    """
+    Generate independent binding proofs for many `(a, r, r1b, r2b)` tuples.
+
+    Every proof only shares the public `register` and `token_name`, so the
+    batch is spread over a process pool (py_ecc holds the GIL, so threads
+    would not help). A single item is proven in-process.
+
+    Args:
+        items: One `(a, r, r1b, r2b)` tuple per proof, as for `binding_proof`.
+        register: Public register shared by every proof.
+        token_name: Context-binding string shared by every proof.
+        max_workers: Pool size; defaults to the CPU count.
+
+    Returns:
+        The `(zab, zrb, t1b, t2b)` tuples, in the order of `items`.
+    """
+    if len(items) <= 1:
+        return [
+            binding_proof(a, r, r1b, r2b, register, token_name)
+            for a, r, r1b, r2b in items
+        ]
+    jobs = [(a, r, r1b, r2b, register, token_name) for a, r, r1b, r2b in items]
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        return list(pool.map(_binding_proof_job, jobs))
+
+
+def _binding_proof_job(
+    job: tuple[int, int, str, str, Register, str],
+) -> tuple[str, str, str, str]:
+    """Unpack one batch entry for `binding_proof` in a worker process."""
+    return binding_proof(*job)
 
 
 def binding_to_file(zab: str, zrb: str, t1b: str, t2b: str) -> None:
@@ -143,20 +215,12 @@ def binding_to_file(zab: str, zrb: str, t1b: str, t2b: str) -> None:
         t2b: Serialized commitment point `t2` (bytes/hex string as expected).
 
     Returns:
-        None. Writes the JSON artifact to disk via `save_json`.
+        None. Writes the JSON artifact to disk via `save_string`; the text is
+        templated by `constr_bytes_json` and matches `save_json` output.
 
     Raises:
-        Any exceptions raised by `save_json` (e.g., due to invalid path,
-        permissions, or serialization issues) will propagate.
+        Any exceptions raised by `save_string` (e.g., due to invalid path
+        or permissions) will propagate.
     """
     path = "../data/binding.json"
-    data = {
-        "constructor": 0,
-        "fields": [
-            {"bytes": zab},
-            {"bytes": zrb},
-            {"bytes": t1b},
-            {"bytes": t2b},
-        ],
-    }
-    save_json(path, data)
+    save_string(path, constr_bytes_json(0, [zab, zrb, t1b, t2b]))
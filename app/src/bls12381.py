@@ -3,10 +3,13 @@
 
 # src/bls12381.py
 
-import secrets
+import os
+from functools import lru_cache
+from types import ModuleType
+from typing import Callable
 from eth_typing import BLSPubkey, BLSSignature
-from src.hashing import generate
-from src.constants import H0, F12_DOMAIN_TAG
+from src.hashing import generate_b
+from src.constants import H0, H1, H2, H3, F12_DOMAIN_TAG_B
 from py_ecc.bls.g2_primitives import (
     G1_to_pubkey,
     G2_to_signature,
@@ -22,21 +25,57 @@ from py_ecc.optimized_bls12_381 import (
     Z2,
     add,
     curve_order,
+    double,
+    field_modulus,
+    is_inf,
     multiply,
     neg,
-    pairing,
+    normalize,
+    twist,
+)
+from py_ecc.optimized_bls12_381.optimized_pairing import (
+    exp_by_p,
+    pseudo_binary_encoding,
+)
+
+# Native backend for the G1/G2 helpers. "auto" uses arkworks when it is
+# installed, "arkworks" requires it, and "py_ecc" forces pure Python.
+BLS_BACKEND = os.environ.get("PEACE_BLS_BACKEND", "auto")
+
+_native: ModuleType | None = None
+if BLS_BACKEND == "arkworks":
+    from src import bls12381_arkworks as _native
+elif BLS_BACKEND == "auto":
+    try:
+        from src import bls12381_arkworks as _native
+    except ImportError:
+        _native = None
+
+# window width (bits) of the fixed-base precomputation tables
+FIXED_BASE_WINDOW = 4
+
+# hard part (p^4 - p^2 + 1) / r of the final exponentiation in base p
+_HARD_PART_DIGITS = tuple(
+    ((field_modulus**4 - field_modulus**2 + 1) // curve_order // field_modulus**i)
+    % field_modulus
+    for i in range(4)
 )
 
 
 def rng() -> int:
     """
-    Generates a random hex string of the specified length using the secrets module.
+    Generates a uniformly random nonzero scalar below the field order.
+
+    Draws 255 bits from the OS CSPRNG and rejects values outside
+    `[1, curve_order)`; about one draw in ten is rejected.
 
     Returns:
         int: A random number below the field order.
     """
-    # Generate a random byte string of the specified length
-    return secrets.randbelow(curve_order - 1) + 1
+    while True:
+        scalar = int.from_bytes(os.urandom(32), "big") >> 1
+        if 0 < scalar < curve_order:
+            return scalar
 
 
 def g1_point(scalar: int) -> str:
@@ -50,7 +89,11 @@ def g1_point(scalar: int) -> str:
     Returns:
         bytes: The resulting BLS12-381 G1 point in compressed format.
     """
-    return G1_to_pubkey(multiply(G1, scalar)).hex()
+    if scalar == 1:
+        return g1_generator
+    if _native is not None:
+        return _native.g1_point(scalar)
+    return G1_to_pubkey(fixed_base_multiply(g1_generator, scalar)).hex()
 
 
 def g2_point(scalar: int) -> str:
@@ -64,7 +107,74 @@ def g2_point(scalar: int) -> str:
     Returns:
         bytes: The resulting BLS12-381 G2 point in compressed format.
     """
-    return G2_to_signature(multiply(G2, scalar)).hex()
+    if scalar == 1:
+        return g2_generator
+    if _native is not None:
+        return _native.g2_point(scalar)
+    return G2_to_signature(fixed_base_multiply(g2_generator, scalar)).hex()
+
+
+@lru_cache(maxsize=None)
+def _fixed_base_table(element: str) -> tuple[tuple[tuple, ...], ...]:
+    """
+    Precompute the windowed multiples of a fixed base point.
+
+    Row `i` holds `[d * 2^(w*i)]P` for every window digit `d` in `[0, 2^w)`,
+    so a scalar multiplication needs one lookup and one addition per window
+    and no doublings. Tables are built on first use and cached by the
+    compressed encoding of the base.
+
+    Args:
+        element (str): The compressed base point.
+
+    Returns:
+        tuple: One row of `2^w` points per window of the scalar field.
+    """
+    base = uncompress(element)
+    identity = Z1 if type(base[2]) is FQ else Z2
+    windows = -(-curve_order.bit_length() // FIXED_BASE_WINDOW)
+    table = []
+    for _ in range(windows):
+        row = [identity, base]
+        for _ in range(2, 1 << FIXED_BASE_WINDOW):
+            row.append(add(row[-1], base))
+        table.append(tuple(row))
+        base = add(row[-1], base)
+    return tuple(table)
+
+
+def fixed_base_multiply(element: str, scalar: int) -> tuple:
+    """
+    Multiply a fixed base point by a scalar using its precomputed table.
+
+    Only members of `FIXED_BASES` are accepted. Tables are cached for the life
+    of the process, so admitting arbitrary points would grow memory without
+    bound.
+
+    Args:
+        element (str): The compressed base point, one of `FIXED_BASES`.
+        scalar (int): The scalar value for multiplication.
+
+    Returns:
+        tuple: The resulting point (uncompressed).
+
+    Raises:
+        ValueError: If `element` is not in `FIXED_BASES`.
+    """
+    if element not in FIXED_BASES:
+        raise ValueError("fixed_base_multiply requires a point in FIXED_BASES")
+    table = _fixed_base_table(element)
+    scalar %= curve_order
+    mask = (1 << FIXED_BASE_WINDOW) - 1
+    result = table[0][0]
+    for row in table:
+        if scalar == 0:
+            break
+        digit = scalar & mask
+        if digit:
+            result = add(result, row[digit])
+        scalar >>= FIXED_BASE_WINDOW
+    return result
 
 
 def uncompress(element: str) -> tuple:
@@ -77,10 +187,40 @@ def uncompress(element: str) -> tuple:
     Returns:
         tuple: The uncompressed point.
     """
-    if len(element) == 96:
-        return pubkey_to_G1(BLSPubkey(bytes.fromhex(element)))
-    else:
-        return signature_to_G2(BLSSignature(bytes.fromhex(element)))
+    return uncompress_b(bytes.fromhex(element))
+
+
+def _uncompress_g1(element: bytes) -> tuple:
+    return pubkey_to_G1(BLSPubkey(element))
+
+
+def _uncompress_g2(element: bytes) -> tuple:
+    return signature_to_G2(BLSSignature(element))
+
+
+# compressed byte length -> point parser
+_UNCOMPRESS: dict[int, Callable[[bytes], tuple]] = {
+    48: _uncompress_g1,
+    96: _uncompress_g2,
+}
+
+
+@lru_cache(maxsize=64)
+def uncompress_b(element: bytes) -> tuple:
+    """
+    Uncompresses raw bytes to a BLS12-381 point.
+
+    Results are cached because the same points (register values, protocol
+    constants) are decompressed, and subgroup checked, on every proof.
+
+    Args:
+        element (bytes): The compressed point (48 bytes for G1, 96 for G2).
+
+    Returns:
+        tuple: The uncompressed point.
+    """
+    # anything that is not a G1 encoding is handed to the G2 parser to reject
+    return _UNCOMPRESS.get(len(element), _uncompress_g2)(element)
 
 
 def compress(element: tuple) -> str:
@@ -93,10 +233,23 @@ def compress(element: tuple) -> str:
     Returns:
         str: The compressed point as a hexadecimal string.
     """
-    if isinstance(element[2], FQ):
-        return G1_to_pubkey(element).hex()
+    return compress_b(element).hex()
+
+
+def compress_b(element: tuple) -> bytes:
+    """
+    Compresses a BLS12-381 point to raw bytes.
+
+    Args:
+        element (tuple): The point to be compressed.
+
+    Returns:
+        bytes: The compressed point.
+    """
+    if type(element[2]) is FQ:
+        return G1_to_pubkey(element)
     else:
-        return G2_to_signature(element).hex()
+        return G2_to_signature(element)
 
 
 def scale(element: str, scalar: int) -> str:
@@ -110,7 +263,17 @@ def scale(element: str, scalar: int) -> str:
     Returns:
         str: The resulting scaled point.
     """
-    return compress(multiply(uncompress(element), scalar))
+    # the generators never need to be decompressed
+    if element == g1_generator:
+        return g1_point(scalar)
+    if element == g2_generator:
+        return g2_point(scalar)
+    if _native is not None:
+        return _native.scale(element, scalar)
+    if element in FIXED_BASES:
+        return compress(fixed_base_multiply(element, scalar))
+    # straight to the cached byte-level decoder and encoder
+    return compress_b(multiply(uncompress_b(bytes.fromhex(element)), scalar)).hex()
 
 
 def invert(element: str) -> str:
@@ -123,7 +286,9 @@ def invert(element: str) -> str:
     Returns:
         str: The resulting combined point.
     """
-    return compress(neg(uncompress(element)))
+    if _native is not None:
+        return _native.invert(element)
+    return compress_b(neg(uncompress_b(bytes.fromhex(element)))).hex()
 
 
 def combine(left_element: str, right_element: str) -> str:
@@ -137,13 +302,253 @@ def combine(left_element: str, right_element: str) -> str:
     Returns:
         str: The resulting combined point.
     """
-    return compress(add(uncompress(left_element), uncompress(right_element)))
+    if _native is not None:
+        return _native.combine(left_element, right_element)
+    left = uncompress_b(bytes.fromhex(left_element))
+    right = uncompress_b(bytes.fromhex(right_element))
+    return compress_b(add(left, right)).hex()
+
+
+def g1_point_b(scalar: int) -> bytes:
+    """
+    Byte-oriented variant of `g1_point`.
+
+    Args:
+        scalar (int): The scalar value for multiplication.
+
+    Returns:
+        bytes: The resulting G1 point in compressed format.
+    """
+    if _native is not None:
+        return bytes.fromhex(_native.g1_point(scalar))
+    return G1_to_pubkey(fixed_base_multiply(g1_generator, scalar))
+
+
+def scale_b(element: bytes, scalar: int) -> bytes:
+    """
+    Byte-oriented variant of `scale`.
+
+    Args:
+        element (bytes): The compressed point to be scaled.
+        scalar (int): The scalar value for multiplication.
+
+    Returns:
+        bytes: The resulting scaled point.
+    """
+    if _native is not None:
+        return bytes.fromhex(_native.scale(element.hex(), scalar))
+    return compress_b(multiply(uncompress_b(element), scalar))
+
+
+def combine_b(left_element: bytes, right_element: bytes) -> bytes:
+    """
+    Byte-oriented variant of `combine`.
+
+    Args:
+        left_element (bytes): A compressed point.
+        right_element (bytes): A compressed point.
+
+    Returns:
+        bytes: The resulting combined point.
+    """
+    if _native is not None:
+        return bytes.fromhex(_native.combine(left_element.hex(), right_element.hex()))
+    return compress_b(add(uncompress_b(left_element), uncompress_b(right_element)))
+
+
+def multi_scale(elements: list[str], scalars: list[int]) -> str:
+    """
+    Computes the multi-scalar multiplication `sum([k_i] P_i)` of points from
+    the same group.
+
+    This is cheaper than scaling each point and combining the results, as
+    the doublings are shared across every term (Pippenger's bucket method).
+
+    Args:
+        elements (list[str]): The compressed points.
+        scalars (list[int]): One scalar per point.
+
+    Returns:
+        str: The resulting compressed point.
+
+    Raises:
+        ValueError: If the inputs are empty or of different lengths.
+    """
+    if not elements or len(elements) != len(scalars):
+        raise ValueError("multi_scale needs one scalar per point")
+    if _native is not None:
+        return _native.multi_scale(elements, scalars)
+    if all(element in FIXED_BASES for element in elements):
+        # table lookups need no doublings at all
+        terms = [fixed_base_multiply(e, k) for e, k in zip(elements, scalars)]
+        total = terms[0]
+        for term in terms[1:]:
+            total = add(total, term)
+        return compress(total)
+    points = [uncompress(element) for element in elements]
+    return compress(_pippenger(points, [k % curve_order for k in scalars]))
+
+
+def _pippenger(points: list[tuple], scalars: list[int]) -> tuple:
+    """
+    Bucket-method multi-scalar multiplication over uncompressed points.
+
+    Args:
+        points (list[tuple]): Points from the same group.
+        scalars (list[int]): Reduced scalars, one per point.
+
+    Returns:
+        tuple: The resulting point (uncompressed).
+    """
+    identity: tuple = Z1 if type(points[0][2]) is FQ else Z2
+    window = min(16, max(2, len(points).bit_length() - 2))
+    mask = (1 << window) - 1
+    top = max(scalars).bit_length()
+    result = identity
+    for shift in reversed(range(0, top, window)):
+        for _ in range(window):
+            result = double(result)
+        buckets = [identity] * mask
+        for point, scalar in zip(points, scalars):
+            digit = (scalar >> shift) & mask
+            if digit:
+                buckets[digit - 1] = add(buckets[digit - 1], point)
+        # sum_d d * B_d as a running sum from the largest bucket down
+        running = identity
+        for bucket in reversed(buckets):
+            running = add(running, bucket)
+            result = add(result, running)
+    return result
+
+
+def _line_coefficients(
+    p1: tuple[FQ12, FQ12, FQ12], p2: tuple[FQ12, FQ12, FQ12]
+) -> tuple[FQ12, FQ12, FQ12, FQ12]:
+    """
+    Split py_ecc's `linefunc` through twisted points `p1`, `p2` into the parts
+    that do not depend on the evaluation point.
+
+    For an affine G1 point `(x, y)` the line evaluates to `(a*x + b*y + c) / d`.
+
+    Returns:
+        tuple: The coefficients `(a, b, c, d)`.
+    """
+    zero = p1[0].zero()
+    x1, y1, z1 = p1
+    x2, y2, z2 = p2
+    m_numerator = y2 * z1 - y1 * z2
+    m_denominator = x2 * z1 - x1 * z2
+    if m_denominator == zero:
+        if m_numerator != zero:
+            # vertical line
+            return z1, zero, -x1, z1
+        # tangent line
+        m_numerator = 3 * x1 * x1
+        m_denominator = 2 * y1 * z1
+    return (
+        m_numerator * z1,
+        -(m_denominator * z1),
+        m_denominator * y1 - m_numerator * x1,
+        m_denominator * z1,
+    )
+
+
+@lru_cache(maxsize=16)
+def _miller_lines(g2_element: str) -> tuple[list[tuple[bool, FQ12, FQ12, FQ12]], FQ12]:
+    """
+    Precompute the Miller loop lines for a G2 point.
+
+    The doubling/addition chain of the loop only depends on the G2 argument,
+    so the line coefficients and the product of all line denominators are
+    computed once per point and reused for every G1 argument.
+
+    Args:
+        g2_element (str): The compressed G2 point.
+
+    Returns:
+        tuple: The `(square, a, b, c)` steps and the inverted denominator.
+    """
+    Q = uncompress(g2_element)
+    R = Q
+    twist_Q = twist(Q)
+    steps = []
+    denominator = FQ12.one()
+    for v in pseudo_binary_encoding[62::-1]:
+        twist_R = twist(R)
+        a, b, c, d = _line_coefficients(twist_R, twist_R)
+        steps.append((True, a, b, c))
+        denominator = denominator * denominator * d
+        R = double(R)
+        if v == 1:
+            a, b, c, d = _line_coefficients(twist(R), twist_Q)  # type: ignore[arg-type]
+            steps.append((False, a, b, c))
+            denominator = denominator * d
+            R = add(R, Q)
+    return steps, FQ12.one() / denominator
+
+
+def conjugate(value: FQ12) -> FQ12:
+    """
+    Compute `value^(p^6)`, which for py_ecc's Fq12 basis negates the odd
+    coefficients.
+
+    Pairing outputs lie in the cyclotomic subgroup where this is the inverse,
+    so `x / y` between final-exponentiated values is `x * conjugate(y)`
+    without a field inversion.
+
+    Args:
+        value (FQ12): An element of Fq12.
+
+    Returns:
+        FQ12: The conjugate of `value`.
+    """
+    return FQ12([c if i % 2 == 0 else -c for i, c in enumerate(value.coeffs)])
+
+
+def final_exponentiation(value: FQ12) -> FQ12:
+    """
+    Raise a Miller loop output to `(p^12 - 1) / r`.
+
+    The easy part `(p^6 - 1)(p^2 + 1)` uses Frobenius maps. The hard part
+    `(p^4 - p^2 + 1) / r` is written in base p as `d0 + d1*p + d2*p^2 + d3*p^3`
+    and evaluated as one joint exponentiation of the four Frobenius images,
+    which needs a third of the multiplications of a plain square-and-multiply.
+    The result is identical to py_ecc's `final_exponentiate`.
+
+    Args:
+        value (FQ12): A Miller loop output.
+
+    Returns:
+        FQ12: The reduced pairing value.
+    """
+    value = exp_by_p(exp_by_p(value)) * value
+    value = conjugate(value) / value
+
+    frobenius = [value]
+    for _ in range(3):
+        frobenius.append(exp_by_p(frobenius[-1]))
+    # table[m] is the product of the Frobenius images selected by the bits of m
+    table = [FQ12.one()] * 16
+    for m in range(1, 16):
+        low = m & -m
+        table[m] = table[m ^ low] * frobenius[low.bit_length() - 1]
+
+    result = FQ12.one()
+    for bit in range(max(d.bit_length() for d in _HARD_PART_DIGITS) - 1, -1, -1):
+        result = result * result
+        m = sum(((d >> bit) & 1) << i for i, d in enumerate(_HARD_PART_DIGITS))
+        if m:
+            result = result * table[m]
+    return result
 
 
 def pair(g1_element: str, g2_element: str, final_exponentiate: bool = True) -> FQ12:
     """
     Compute the pairing operation on elliptic curve points represented as strings.
 
+    The Miller loop reuses the cached line coefficients of the G2 point, which
+    pays off for repeated pairings against the same point such as H0.
+
     Args:
         g2_element (str): A string representation of a point on G2 elliptic curve.
         g1_element (str): A string representation of a point on G1 elliptic curve.
@@ -152,10 +557,46 @@ def pair(g1_element: str, g2_element: str, final_exponentiate: bool = True) -> F
     Returns:
         FQ12: Result of the pairing operation as an element of the FQ12 field.
     """
-    return pairing(uncompress(g2_element), uncompress(g1_element), final_exponentiate)
+    P = uncompress(g1_element)
+    if is_inf(P) or is_inf(uncompress(g2_element)):
+        return FQ12.one()
+    steps, inverse_denominator = _miller_lines(g2_element)
+    x, y = (int(c) for c in normalize(P))
+    f = FQ12.one()
+    for square, a, b, c in steps:
+        line = a * x + b * y + c
+        f = f * f * line if square else f * line
+    f = f * inverse_denominator
+    return final_exponentiation(f) if final_exponentiate else f
+
+
+def pairing_check(g1_elements: list[str], g2_elements: list[str]) -> bool:
+    """
+    Check whether a product of pairings is the identity:
+
+        prod e(g1_elements[i], g2_elements[i]) == 1
+
+    The Miller loops are multiplied together so only one final
+    exponentiation is needed. Unlike `pair`, the result is a boolean that
+    does not depend on the Fq12 representation, so the native backend
+    handles it when available.
+
+    Args:
+        g1_elements (list[str]): Compressed G1 points.
+        g2_elements (list[str]): Compressed G2 points, one per G1 point.
+
+    Returns:
+        bool: True if the product of pairings is one.
+    """
+    if _native is not None:
+        return _native.pairing_check(g1_elements, g2_elements)
+    f = FQ12.one()
+    for g1_element, g2_element in zip(g1_elements, g2_elements):
+        f = f * pair(g1_element, g2_element, final_exponentiate=False)
+    return final_exponentiation(f) == FQ12.one()
 
 
-def fq12_encoding(value: FQ12, domain_tag: str) -> str:
+def fq12_encoding(value: FQ12, domain_tag: str | bytes) -> str:
     """
     Encode an FQ12 element into a hex string.
 
@@ -165,14 +606,15 @@ def fq12_encoding(value: FQ12, domain_tag: str) -> str:
 
     Args:
         value: The FQ12 field element to encode.
+        domain_tag: Tag appended to the encoding; strings are hashed as utf-8.
 
     Returns:
         A hex string representing the byte encoding of the FQ12 element.
     """
-    byte_data = b""
-    for fq_component in value.coeffs:
-        byte_data += int(fq_component).to_bytes(48, "big")
-    return generate(byte_data.hex() + domain_tag.encode("utf-8").hex())
+    byte_data = b"".join(int(c).to_bytes(48, "big") for c in value.coeffs)
+    if isinstance(domain_tag, str):
+        domain_tag = domain_tag.encode("utf-8")
+    return generate_b(byte_data, domain_tag)
 
 
 def random_fq12(a: int) -> str:
@@ -196,7 +638,7 @@ def random_fq12(a: int) -> str:
         Fq12 element.
     """
     kappa = pair(scale(g1_point(1), a), H0)
-    return fq12_encoding(kappa, F12_DOMAIN_TAG)
+    return fq12_encoding(kappa, F12_DOMAIN_TAG_B)
 
 
 def to_int(hash_digest: str) -> int:
@@ -243,6 +685,33 @@ def from_int(integer: int) -> str:
     return integer.to_bytes(length, "big").hex()
 
 
+def from_scalar(integer: int) -> str:
+    """
+    Encode a scalar field element as a fixed-width 32-byte big-endian hex
+    string.
+
+    The on-chain `scalar.from_bytes` accepts any width, so this is
+    interchangeable with `from_int` for values below the curve order.
+
+    Args:
+        integer: Integer in `[0, curve_order)`.
+
+    Returns:
+        A 64-character hex string.
+    """
+    return integer.to_bytes(32, "big").hex()
+
+
+# generators
+g1_generator = compress(G1)
+g2_generator = compress(G2)
+
+# -H0, used for every re-encryption hop
+h0_negated = compress(neg(uncompress(H0)))
+
+# protocol points that are always scaled through precomputed tables
+FIXED_BASES = frozenset({g1_generator, g2_generator, H0, H1, H2, H3, h0_negated})
+
 # identity elements
 g1_identity = compress(Z1)
 g2_identity = compress(Z2)
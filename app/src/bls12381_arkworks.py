@@ -0,0 +1,82 @@
+# Copyright (C) 2025 Logical Mechanism LLC
+# SPDX-License-Identifier: GPL-3.0-only
+
+# src/bls12381_arkworks.py
+
+"""
+Native BLS12-381 group operations backed by `py_arkworks_bls12381`.
+
+This is an optional backend for the G1/G2 helpers in `src.bls12381`. It is
+picked up automatically whenever the package is importable (the default
+`PEACE_BLS_BACKEND=auto`); `PEACE_BLS_BACKEND=py_ecc` forces the pure-Python
+implementation and `PEACE_BLS_BACKEND=arkworks` makes a missing package an
+import error.
+
+All functions keep the hex-string API of `src.bls12381` (compressed points
+in the ZCash serialization format), so callers do not change. Pairings are
+not routed through this module because the `fq12_encoding` transcript depends
+on py_ecc's Fq12 coefficient layout; `pairing_check` only answers whether a
+product of pairings is one, so it has no such dependency.
+"""
+
+from py_arkworks_bls12381 import GT, G1Point, G2Point, Scalar
+from py_ecc.optimized_bls12_381 import curve_order
+
+# compressed G1 points are 48 bytes / 96 hex chars
+G1_HEX_LENGTH = 96
+
+
+def _to_scalar(scalar: int) -> Scalar:
+    """Reduce an arbitrary integer into the scalar field."""
+    return Scalar(scalar % curve_order)
+
+
+def _decode(element: str) -> G1Point | G2Point:
+    """Decode a compressed G1 or G2 hex string, choosing the group by length."""
+    if len(element) == G1_HEX_LENGTH:
+        return G1Point.from_compressed_bytes(bytes.fromhex(element))
+    return G2Point.from_compressed_bytes(bytes.fromhex(element))
+
+
+def g1_point(scalar: int) -> str:
+    """Compute `[scalar]G1` and return it compressed."""
+    return (G1Point() * _to_scalar(scalar)).to_compressed_bytes().hex()
+
+
+def g2_point(scalar: int) -> str:
+    """Compute `[scalar]G2` and return it compressed."""
+    return (G2Point() * _to_scalar(scalar)).to_compressed_bytes().hex()
+
+
+def scale(element: str, scalar: int) -> str:
+    """Scale a compressed G1/G2 point by `scalar`."""
+    return (_decode(element) * _to_scalar(scalar)).to_compressed_bytes().hex()
+
+
+def invert(element: str) -> str:
+    """Negate a compressed G1/G2 point."""
+    return (-_decode(element)).to_compressed_bytes().hex()
+
+
+def combine(left_element: str, right_element: str) -> str:
+    """Add two compressed points from the same group."""
+    left = _decode(left_element)
+    right = _decode(right_element)
+    return (left + right).to_compressed_bytes().hex()  # type: ignore[operator]
+
+
+def multi_scale(elements: list[str], scalars: list[int]) -> str:
+    """Multi-scalar multiplication of compressed points from one group."""
+    values = [_to_scalar(k) for k in scalars]
+    if len(elements[0]) == G1_HEX_LENGTH:
+        g1 = [G1Point.from_compressed_bytes(bytes.fromhex(e)) for e in elements]
+        return G1Point.multiexp_unchecked(g1, values).to_compressed_bytes().hex()
+    g2 = [G2Point.from_compressed_bytes(bytes.fromhex(e)) for e in elements]
+    return G2Point.multiexp_unchecked(g2, values).to_compressed_bytes().hex()
+
+
+def pairing_check(g1_elements: list[str], g2_elements: list[str]) -> bool:
+    """Check that `prod e(g1_i, g2_i)` is the identity of GT."""
+    g1 = [G1Point.from_compressed_bytes(bytes.fromhex(e)) for e in g1_elements]
+    g2 = [G2Point.from_compressed_bytes(bytes.fromhex(e)) for e in g2_elements]
+    return GT.pairing_check(g1, g2)
@@ -9,13 +9,14 @@ from src.bls12381 import (
     to_int,
     rng,
     scale,
-    g1_point,
+    g1_generator,
     combine,
     curve_order,
-    g2_point,
-    invert,
+    g2_generator,
+    h0_negated,
+    multi_scale,
 )
-from src.hashing import generate
+from src.hashing import generate, generate_branches
 from src.register import Register
 from src.ecies import encrypt, capsule_to_file, decrypt
 from src.payload import parse_payload
@@ -25,7 +26,91 @@ from src.binding import binding_proof, binding_to_file
 from src.files import save_string, load_json
 from src.snark import gt_to_hash, decrypt_to_hash, generate_snark_proof
 from src.groth_convert import convert_all
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
+from typing import Any, Callable
+
+# the app directory and the gnark binary, resolved once at import
+APP_PATH = Path(__file__).resolve().parent.parent
+SNARK_PATH = APP_PATH / "snark" / "snark"
+
+# one shared worker for the snark subprocess; commands run it one at a time
+_BACKGROUND = ThreadPoolExecutor(max_workers=1, thread_name_prefix="snark")
+
+
+def _in_background(fn: Callable[..., Any], *args: Any) -> Future:
+    """
+    Run `fn(*args)` on the shared worker thread and return its future.
+
+    Used to overlap the snark binary subprocess, which waits outside the GIL,
+    with the group arithmetic that does not depend on its output.
+    """
+    return _BACKGROUND.submit(fn, *args)
+
+
+def _wallet_secret(wallet_path: str) -> int:
+    """
+    Derive a user's scalar secret `sk` from their wallet key.
+
+    Args:
+        wallet_path: Path to wallet material (as expected by `extract_key`).
+
+    Returns:
+        The secret scalar `sk`.
+    """
+    return _key_secret(extract_key(wallet_path))
+
+
+@lru_cache(maxsize=16)
+def _key_secret(key: str) -> int:
+    """
+    Domain separate a wallet key with `KEY_DOMAIN_TAG` and reduce it to `sk`.
+
+    Cached per key rather than per path, so a wallet file rewritten in place
+    yields the new secret while sequential commands still derive it once.
+    """
+    return to_int(generate(KEY_DOMAIN_TAG + key))
+
+
+@lru_cache(maxsize=16)
+def _secret_public(sk: int) -> str:
+    """
+    Compute the public value `u = [sk]G1`, cached so repeated commands for
+    the same wallet skip the scalar multiplication.
+    """
+    return scale(g1_generator, sk)
+
+
+def _secret_register(sk: int) -> Register:
+    """
+    Build a fresh secret-known register for `sk` from its cached public value.
+    """
+    user = Register.from_public(g1_generator, _secret_public(sk))
+    user.x = sk
+    return user
+
+
+def _register_and_prove(sk: int) -> Register:
+    """
+    Write the register for `sk` and a fresh Schnorr proof for it.
+
+    This is shared by the encryption and bidding transactions. Only the public
+    value `u = [sk]G1` is cached (see `_secret_public`); the register, the
+    proof and both files are rebuilt on every call.
+
+    Args:
+        sk: The wallet owner's secret scalar (see `_wallet_secret`).
+
+    Returns:
+        The owner's register.
+    """
+    user = _secret_register(sk)
+    user.to_file()
+
+    zb, grb = schnorr_proof(user)
+    schnorr_to_file(zb, grb)
+    return user
 
 
 def create_snark_tx(bob_public_value: str) -> tuple[int, int, int]:
@@ -59,32 +144,30 @@ def create_snark_tx(bob_public_value: str) -> tuple[int, int, int]:
             r0: The sampled secret scalar.
             hk: The derived hop key scalar (`to_int(m0)`).
     """
-    current = Path(__file__).resolve().parent.parent
-    snark_path = current / "snark" / "snark"
-    out_path = current / "out"
-    setup_path = current / "circuit"
+    out_path = APP_PATH / "out"
+    setup_path = APP_PATH / "circuit"
 
     gnark_proof_path = out_path / "proof.json"
     gnark_public_path = out_path / "public.json"
-    datum_path = current / "data" / "groth"
+    datum_path = APP_PATH / "data" / "groth"
 
     # these are secrets
     a0 = rng()
     r0 = rng()
     # use gnark encoding for gt
-    m0 = gt_to_hash(a0, snark_path)
+    m0_future = _in_background(gt_to_hash, a0, SNARK_PATH)
 
-    hk = to_int(m0)
+    w1 = combine(scale(g1_generator, a0), scale(bob_public_value, r0))
 
-    w0 = scale(g1_point(1), hk)
-    w1 = combine(scale(g1_point(1), a0), scale(bob_public_value, r0))
+    hk = to_int(m0_future.result())
+    w0 = scale(g1_generator, hk)
     generate_snark_proof(
         a0,
         r0,
         bob_public_value,
         w0,
         w1,
-        snark_path=snark_path,
+        snark_path=SNARK_PATH,
         out_dir=out_path,
         setup_dir=setup_path,
     )
@@ -103,24 +186,28 @@ def create_encryption_tx(
     all required on-chain/off-chain artifacts to disk.
 
     High-level steps:
-    1. Sample secrets `a0`, `r0` and derive an Fq12 value `m0 = e([a0]G1, H0)`.
+    1. Sample secrets `a0`, `r0` and start deriving the Fq12 value
+       `m0 = e([a0]G1, H0)` with the snark binary on `_BACKGROUND`.
     2. Derive Alice's scalar secret `sk` from her wallet key (domain separated
-       using `KEY_DOMAIN_TAG`) and write her register to file.
-    3. Produce a Schnorr proof of knowledge for the register and write it to file.
-    4. Compute the entry points:
+       using `KEY_DOMAIN_TAG`).
+    3. Compute the entry points:
          r1b    = [r0]G1
          r2_g1b = [a0 + r0*sk]G1
        and compute the level commitment term `r4b` using transcript-derived
        scalars `a,b` (domain separated via `H2I_DOMAIN_TAG`).
-    5. Write the half-level entry `(r1b, r2_g1b, r4b)` to disk.
-    6. Encrypt `payload` under a key derived from `(r1b, m0)` and write the
+    4. Join `m0`. This happens before the first write, so a failed snark call
+       leaves no artifacts behind.
+    5. Write Alice's register and a Schnorr proof of knowledge for it.
+    6. Write the half-level entry `(r1b, r2_g1b, r4b)` and an empty full level.
+    7. Encrypt `payload` under a key derived from `(r1b, m0)` and write the
        capsule (nonce/aad/ciphertext) to disk.
-    7. Produce a binding proof tying `(a0, r0)` to the transcript and write it.
+    8. Produce a binding proof tying `(a0, r0)` to the transcript and write it.
 
-    Side effects (writes files):
+    Side effects (writes files, in this order):
     - User register via `Register.to_file()`
     - Schnorr proof via `schnorr_to_file(...)`
     - Half level via `half_level_to_file(...)`
+    - Empty full level via `empty_full_level_to_file()`
     - Capsule via `capsule_to_file(...)`
     - Binding proof via `binding_to_file(...)`
 
@@ -138,31 +225,29 @@ def create_encryption_tx(
         - All point/scalar encodings are assumed to be the ones your `src.*`
           modules expect (hex strings / serialized points).
     """
-    current = Path(__file__).resolve().parent.parent
-    snark_path = current / "snark" / "snark"
-
     # these are secrets
     a0 = rng()
     r0 = rng()
-    # use gnark encoding for gt
-    m0 = gt_to_hash(a0, snark_path)
+    # use gnark encoding for gt; the entry points below do not need it
+    m0_future = _in_background(gt_to_hash, a0, SNARK_PATH)
 
-    key = extract_key(alice_wallet_path)
-    sk = to_int(generate(KEY_DOMAIN_TAG + key))
-    user = Register(x=sk)
-    user.to_file()
+    sk = _wallet_secret(alice_wallet_path)
 
-    zb, grb = schnorr_proof(user)
-    schnorr_to_file(zb, grb)
+    r1b = scale(g1_generator, r0)
+    r2_g1b = scale(g1_generator, (a0 + r0 * sk) % curve_order)
 
-    r1b = scale(g1_point(1), r0)
-    r2_g1b = scale(g1_point(1), (a0 + r0 * sk) % curve_order)
+    a_digest, b_digest = generate_branches(
+        H2I_DOMAIN_TAG + r1b, "", r2_g1b + token_name
+    )
+    a, b = to_int(a_digest), to_int(b_digest)
 
-    a = to_int(generate(H2I_DOMAIN_TAG + r1b))
-    b = to_int(generate(H2I_DOMAIN_TAG + r1b + r2_g1b + token_name))
+    # r4 = [r0]([a]H1 + [b]H2 + H3) as a single multi-scalar multiplication
+    r4b = multi_scale([H1, H2, H3], [r0 * a % curve_order, r0 * b % curve_order, r0])
 
-    c = combine(combine(scale(H1, a), scale(H2, b)), H3)
-    r4b = scale(c, r0)
+    # join before the first write so a failed snark call leaves no artifacts
+    m0 = m0_future.result()
+
+    user = _register_and_prove(sk)
 
     half_level_to_file(r1b, r2_g1b, r4b)
     empty_full_level_to_file()
@@ -192,13 +277,7 @@ def create_bidding_tx(bob_wallet_path: str) -> None:
     Returns:
         None. Writes artifacts to `../data/*`.
     """
-    key = extract_key(bob_wallet_path)
-    sk = to_int(generate(KEY_DOMAIN_TAG + key))
-    user = Register(x=sk)
-    user.to_file()
-
-    zb, grb = schnorr_proof(user)
-    schnorr_to_file(zb, grb)
+    _register_and_prove(_wallet_secret(bob_wallet_path))
 
 
 def create_reencryption_tx(
@@ -225,7 +304,7 @@ def create_reencryption_tx(
          r2_g1b = [a1]G1 + [r1] * bob_public_value
        then compute `r4b` similarly to the encryption step and write the half-level.
     5. Compute:
-         r5b     = [hk]G2 + [sk] * (-H0)   (implemented as [hk]G2 + [sk]*invert(H0))
+         r5b     = [hk]G2 + [sk] * (-H0)   (-H0 is the precomputed `h0_negated`)
          witness = [hk]G1
        and write them to disk.
     6. Produce a binding proof for this hop against Bob's public register context.
@@ -253,28 +332,28 @@ def create_reencryption_tx(
     Notes / assumptions:
         - The JSON structure in encryption-datum.json is assumed to match the
           shape accessed by the indexing code in this function.
-        - `invert(H0)` is assumed to represent the group inverse of `H0` in the
-          representation expected by your BLS helpers.
+        - `h0_negated` is the group inverse of `H0`, computed once at import.
     """
-    key = extract_key(alice_wallet_path)
-    sk = to_int(generate(KEY_DOMAIN_TAG + key))
+    sk = _wallet_secret(alice_wallet_path)
 
-    r1b = scale(g1_point(1), r1)
-    r2_g1b = combine(scale(g1_point(1), a1), scale(bob_public_value, r1))
+    r1b = scale(g1_generator, r1)
+    r2_g1b = combine(scale(g1_generator, a1), scale(bob_public_value, r1))
 
-    a = to_int(generate(H2I_DOMAIN_TAG + r1b))
-    b = to_int(generate(H2I_DOMAIN_TAG + r1b + r2_g1b + token_name))
-    c = combine(scale(H1, a), scale(H2, b))
-    r4b = scale(c, r1)
+    a_digest, b_digest = generate_branches(
+        H2I_DOMAIN_TAG + r1b, "", r2_g1b + token_name
+    )
+    a, b = to_int(a_digest), to_int(b_digest)
+    # r4 = [r1]([a]H1 + [b]H2) as a single multi-scalar multiplication
+    r4b = multi_scale([H1, H2], [r1 * a % curve_order, r1 * b % curve_order])
 
     half_level_to_file(r1b, r2_g1b, r4b)
 
-    r5b = combine(scale(g2_point(1), hk), scale(invert(H0), sk))
+    r5b = combine(scale(g2_generator, hk), scale(h0_negated, sk))
     save_string("../data/r5.point", r5b)
-    witness = scale(g1_point(1), hk)
+    witness = scale(g1_generator, hk)
     save_string("../data/witness.point", witness)
 
-    user = Register.from_public(g1_point(1), bob_public_value)
+    user = Register.from_public(g1_generator, bob_public_value)
     zab, zrb, t1b, t2b = binding_proof(a1, r1, r1b, r2_g1b, user, token_name)
     binding_to_file(zab, zrb, t1b, t2b)
 
@@ -365,11 +444,8 @@ def recursive_decrypt(
         - `fq12_encoding` is assumed to be deterministic and compatible with
           the key derivation expected by `decrypt`.
     """
-    current = Path(__file__).resolve().parent.parent
-    snark_path = current / "snark" / "snark"
 
-    key = extract_key(alice_wallet_path)
-    sk = to_int(generate(KEY_DOMAIN_TAG + key))
+    sk = _wallet_secret(alice_wallet_path)
 
     # if we can reproduce this with koios then this function can remain the same.
     encryption_datum = load_json(encryption_datum_path)
@@ -381,9 +457,9 @@ def recursive_decrypt(
 
     r1 = half_level["fields"][0]["bytes"]
     r2_g1b = half_level["fields"][1]["bytes"]
-    key = decrypt_to_hash(r1, r2_g1b, None, shared, snark_path)
+    key = decrypt_to_hash(r1, r2_g1b, None, shared, SNARK_PATH)
     k = to_int(key)
-    shared = scale(g2_point(1), k)
+    shared = scale(g2_generator, k)
 
     full_levels = all_entries[1:]
     for entry in full_levels:
@@ -391,11 +467,11 @@ def recursive_decrypt(
         r1 = entry["fields"][0]["bytes"]
         r2_g1b = entry["fields"][1]["bytes"]
         r2_g2b = entry["fields"][2]["bytes"]
-        key = decrypt_to_hash(r1, r2_g1b, r2_g2b, shared, snark_path)
+        key = decrypt_to_hash(r1, r2_g1b, r2_g2b, shared, SNARK_PATH)
 
         # print(key)
         k = to_int(key)
-        shared = scale(g2_point(1), k)
+        shared = scale(g2_generator, k)
     capsule = encryption_datum["fields"][5]
 
     nonce = capsule["fields"][0]["bytes"]
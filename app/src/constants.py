@@ -12,6 +12,12 @@ SCH_DOMAIN_TAG = "SCHNORR|PROOF|v1|".encode("utf-8").hex()
 BND_DOMAIN_TAG = "BINDING|PROOF|v1|".encode("utf-8").hex()
 H2I_DOMAIN_TAG = "HASH|To|Int|v1|".encode("utf-8").hex()
 
+# pre-encoded domain tags for the byte-oriented hashing paths
+SCH_DOMAIN_TAG_B = bytes.fromhex(SCH_DOMAIN_TAG)
+BND_DOMAIN_TAG_B = bytes.fromhex(BND_DOMAIN_TAG)
+# fq12_encoding hashes the utf-8 of the hex tag, not the decoded tag
+F12_DOMAIN_TAG_B = F12_DOMAIN_TAG.encode("utf-8")
+
 # wang public G2 points
 H0 = "a5acbe8bdb762cf7b4bfa9171b9ffa23b6ed710b290280b271a0258e285354aac338bb9e5a9ee41b4454e4c410f40eea16c82b493986bfc754aa789e1408b2b526f8b92e9ddcd4eee1a6c4daa84d561a6ceb452afc4559fe81a1c7f3f26715db"
 H1 = "a1dcce801cd2950dcad45faa854382bbe39f5f84d1855ed4ad2d5d2a8e94b67b2d126fbafbcd1a4f15b82f793f5c8cc80d5638f2260b3e3d0c3bcf1b45f7cc0f72f5a8d7a6d6e6615f7d72ab7e70dcbb56d1fefdb72c65f7bc5f073373cc99a7"
@@ -8,11 +8,47 @@ from src.constants import SLT_DOMAIN_TAG, KEM_DOMAIN_TAG, AAD_DOMAIN_TAG, MSG_DO
 from cryptography.hazmat.primitives.ciphers.aead import AESGCM
 from cryptography.hazmat.primitives.kdf.hkdf import HKDF
 from cryptography.hazmat.primitives import hashes
+from functools import lru_cache
 from os import urandom
-from src.files import save_json
+from src.files import constr_bytes_json, save_string
 
+# HKDF info is the utf-8 of the hex tag, mirrored by the UI's ecies.ts
+KEM_INFO = KEM_DOMAIN_TAG.encode("utf-8")
 
-def encrypt(context: str, kem: str, msg: bytes) -> tuple[str, str, str]:
+
+@lru_cache(maxsize=16)
+def _cipher(context: str, kem: str) -> AESGCM:
+    """
+    Derive the AES-256-GCM cipher shared by `encrypt` and `decrypt`.
+
+    The salt is the utf-8 encoding of the hex digest, not the digest bytes;
+    the UI derives it the same way, so this must not change. Ciphers are
+    cached per `(context, kem)` so repeated calls in one process skip the
+    HKDF and reuse the initialised cipher context.
+    """
+    salt = generate(SLT_DOMAIN_TAG + context + KEM_DOMAIN_TAG)
+    hkdf = HKDF(
+        algorithm=hashes.SHA3_256(),
+        length=32,
+        salt=salt.encode("utf-8"),
+        info=KEM_INFO,
+    )
+    return AESGCM(hkdf.derive(bytes.fromhex(kem)))
+
+
+def reset_aesgcm_cache() -> None:
+    """
+    Drop every cipher cached by `_cipher` in this process.
+
+    Call this after changing how keys are derived (tests that swap
+    `generate`, or a rotated domain tag) so stale ciphers are not reused.
+    """
+    _cipher.cache_clear()
+
+
+def encrypt(
+    context: str, kem: str, msg: bytes | bytearray | memoryview
+) -> tuple[str, str, str]:
     """
     Encrypt raw bytes using AES-256-GCM with a key derived from a KEM value.
 
@@ -36,7 +72,8 @@ def encrypt(context: str, kem: str, msg: bytes) -> tuple[str, str, str]:
             AAD to a particular protocol transcript (e.g., r1 point encoding).
         kem: Hex string representing the key encapsulation material used as HKDF
             input keying material (IKM). Must be valid hex.
-        msg: Plaintext bytes to encrypt (e.g., canonical CBOR payload).
+        msg: Plaintext bytes to encrypt (e.g., canonical CBOR payload). Any
+            bytes-like buffer is passed to AES-GCM as is, without a copy.
 
     Returns:
         A tuple `(nonce_hex, aad_hex, ct_hex)` where:
@@ -50,19 +87,12 @@ def encrypt(context: str, kem: str, msg: bytes) -> tuple[str, str, str]:
         - The random nonce is generated with `os.urandom(12)`; nonce reuse with
           the same derived key breaks AES-GCM security.
     """
-    salt = generate(SLT_DOMAIN_TAG + context + KEM_DOMAIN_TAG)
-    hkdf = HKDF(
-        algorithm=hashes.SHA3_256(),
-        length=32,
-        salt=salt.encode("utf-8"),
-        info=KEM_DOMAIN_TAG.encode("utf-8"),
-    )
-    aes_key = hkdf.derive(bytes.fromhex(kem))
+    aesgcm = _cipher(context, kem)
 
     aad = generate(AAD_DOMAIN_TAG + context + MSG_DOMAIN_TAG)
 
     nonce = urandom(12)
-    ct = AESGCM(aes_key).encrypt(nonce, msg, bytes.fromhex(aad))
+    ct = aesgcm.encrypt(nonce, msg, bytes.fromhex(aad))
     return nonce.hex(), aad, ct.hex()
 
 
@@ -93,15 +123,7 @@ def decrypt(context: str, kem: str, nonce: str, ct: str, aad: str) -> bytes:
         ValueError:
             If any hex inputs are malformed.
     """
-    salt = generate(SLT_DOMAIN_TAG + context + KEM_DOMAIN_TAG)
-    hkdf = HKDF(
-        algorithm=hashes.SHA3_256(),
-        length=32,
-        salt=salt.encode("utf-8"),
-        info=KEM_DOMAIN_TAG.encode("utf-8"),
-    )
-    aes_key = hkdf.derive(bytes.fromhex(kem))
-    return AESGCM(aes_key).decrypt(
+    return _cipher(context, kem).decrypt(
         bytes.fromhex(nonce), bytes.fromhex(ct), bytes.fromhex(aad)
     )
 
@@ -129,19 +151,10 @@ def capsule_to_file(nonce: str, aad: str, ct: str) -> None:
         ct: Hex-encoded ciphertext (includes GCM tag).
 
     Returns:
-        None. Writes the JSON artifact to disk via `save_json`.
+        None. Writes the JSON artifact to disk via `save_string`.
 
     Raises:
-        Any exceptions raised by `save_json` (e.g., invalid path or permissions)
+        Any exceptions raised by `save_string` (e.g., invalid path or permissions)
         will propagate.
     """
-    path = "../data/capsule.json"
-    data = {
-        "constructor": 0,
-        "fields": [
-            {"bytes": nonce},
-            {"bytes": aad},
-            {"bytes": ct},
-        ],
-    }
-    save_json(path, data)
+    save_string("../data/capsule.json", constr_bytes_json(0, [nonce, aad, ct]))
@@ -4,9 +4,11 @@
 # src/files.py
 
 import json
+import os
 
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from typing import Any, Sequence
 
 
 def save_string(path: str | Path, string: str) -> None:
@@ -59,8 +61,50 @@ def save_json(path: str | Path, data: Any) -> None:
     """
     path = Path(path)
     path.parent.mkdir(parents=True, exist_ok=True)
+    # encode in one pass and write once; json.dump issues a write per token
+    text = json.dumps(data, indent=2, sort_keys=True)
     with path.open("w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, sort_keys=True)
+        f.write(text)
+
+
+def constr_bytes_json(constructor: int, fields: Sequence[str]) -> str:
+    """
+    Render a Plutus constructor whose fields are all `{"bytes": ...}` values.
+
+    The text is byte-identical to `save_json` output for the equivalent dict,
+    but is produced from a template instead of the `json` encoder. Fields
+    must already be lowercase hex strings; they are not escaped.
+
+    Args:
+        constructor: The constructor index.
+        fields: Hex strings, one per field, in order.
+
+    Returns:
+        The JSON document as a string.
+    """
+    if not fields:
+        return f'{{\n  "constructor": {constructor},\n  "fields": []\n}}'
+    items = ",\n".join(f'    {{\n      "bytes": "{f}"\n    }}' for f in fields)
+    return f'{{\n  "constructor": {constructor},\n  "fields": [\n{items}\n  ]\n}}'
+
+
+def constr_wrap_json(constructor: int, inner: str) -> str:
+    """
+    Render a Plutus constructor whose single field is another constructor.
+
+    `inner` is a document already rendered by `constr_bytes_json` (or by this
+    function); it is re-indented one level so the result stays byte-identical
+    to `save_json` output for the equivalent nested dict.
+
+    Args:
+        constructor: The outer constructor index.
+        inner: The rendered inner constructor.
+
+    Returns:
+        The JSON document as a string.
+    """
+    body = inner.replace("\n", "\n    ")
+    return f'{{\n  "constructor": {constructor},\n  "fields": [\n    {body}\n  ]\n}}'
 
 
 def extract_key(file_path: str) -> str:
@@ -76,6 +120,10 @@ def extract_key(file_path: str) -> str:
     tag). The function does not validate the format beyond the presence of the
     key and the slice.
 
+    Results are kept in a process-local cache keyed by the absolute path and
+    the file's modification time, so a rewritten wallet file is re-read on the
+    next call. Use `invalidate_key_cache` to drop everything explicitly.
+
     Args:
         file_path: Path to a JSON file containing a `"cborHex"` field.
 
@@ -88,11 +136,25 @@ def extract_key(file_path: str) -> str:
         KeyError: If `"cborHex"` is missing.
         TypeError: If `"cborHex"` is not a string/sliceable.
     """
-    with open(file_path, "r") as file:
+    path = os.path.abspath(file_path)
+    return _read_key(path, os.stat(path).st_mtime_ns)
+
+
+@lru_cache(maxsize=16)
+def _read_key(path: str, mtime_ns: int) -> str:
+    # mtime_ns is only part of the cache key
+    with open(path, "r") as file:
         data = json.load(file)
         return data["cborHex"][4:]
 
 
+def invalidate_key_cache() -> None:
+    """
+    Drop every key cached by `extract_key` in this process.
+    """
+    _read_key.cache_clear()
+
+
 def load_json(path: str | Path) -> Any:
     """
     Load and parse a JSON file.
@@ -89,6 +89,18 @@ def gnark_commitment_wires_to_aiken(gnark_public: dict[str, Any]) -> dict[str, A
         return {"list": []}
 
 
+def _read_json(path: str | Path) -> Any:
+    """Parse a gnark JSON output file."""
+    with open(path, "r") as f:
+        return json.load(f)
+
+
+def _write_json(path: str | Path, data: Any) -> None:
+    """Write an Aiken/Cardano JSON file in one write."""
+    with open(path, "w") as f:
+        f.write(json.dumps(data, indent=4))
+
+
 def convert_proof_file(
     gnark_proof_path: str | Path,
     output_path: str | Path,
@@ -100,13 +112,8 @@ def convert_proof_file(
         gnark_proof_path: Path to gnark's proof.json
         output_path: Path to write Aiken/Cardano JSON
     """
-    with open(gnark_proof_path, "r") as f:
-        gnark_proof = json.load(f)
-
-    aiken_proof = gnark_proof_to_aiken(gnark_proof)
-
-    with open(output_path, "w") as f:
-        json.dump(aiken_proof, f, indent=4)
+    aiken_proof = gnark_proof_to_aiken(_read_json(gnark_proof_path))
+    _write_json(output_path, aiken_proof)
 
 
 def convert_public_file(
@@ -120,13 +127,8 @@ def convert_public_file(
         gnark_public_path: Path to gnark's public.json
         output_path: Path to write Aiken/Cardano JSON
     """
-    with open(gnark_public_path, "r") as f:
-        gnark_public = json.load(f)
-
-    aiken_public = gnark_public_to_aiken(gnark_public)
-
-    with open(output_path, "w") as f:
-        json.dump(aiken_public, f, indent=4)
+    aiken_public = gnark_public_to_aiken(_read_json(gnark_public_path))
+    _write_json(output_path, aiken_public)
 
 
 def convert_commitment_wires_file(
@@ -140,13 +142,8 @@ def convert_commitment_wires_file(
         gnark_public_path: Path to gnark's public.json
         output_path: Path to write Aiken/Cardano JSON
     """
-    with open(gnark_public_path, "r") as f:
-        gnark_public = json.load(f)
-
-    aiken_wires = gnark_commitment_wires_to_aiken(gnark_public)
-
-    with open(output_path, "w") as f:
-        json.dump(aiken_wires, f, indent=4)
+    aiken_wires = gnark_commitment_wires_to_aiken(_read_json(gnark_public_path))
+    _write_json(output_path, aiken_wires)
 
 
 def convert_all(
@@ -172,5 +169,10 @@ def convert_all(
     output_dir.mkdir(parents=True, exist_ok=True)
 
     convert_proof_file(gnark_proof_path, output_dir / proof_filename)
-    convert_public_file(gnark_public_path, output_dir / public_filename)
-    convert_commitment_wires_file(gnark_public_path, output_dir / wires_filename)
+
+    # public.json feeds both the public inputs and the commitment wires
+    gnark_public = _read_json(gnark_public_path)
+    _write_json(output_dir / public_filename, gnark_public_to_aiken(gnark_public))
+    _write_json(
+        output_dir / wires_filename, gnark_commitment_wires_to_aiken(gnark_public)
+    )
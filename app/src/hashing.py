@@ -23,3 +23,56 @@ def generate(input_string: str) -> str:
     ).hexdigest()
 
     return hash_digest
+
+
+def generate_b(*chunks: bytes) -> str:
+    """
+    Calculates the blake2b_224 hash digest of raw byte chunks, in order.
+
+    Args:
+        *chunks (bytes): Byte strings hashed in order.
+
+    Returns:
+        str: The blake2b_224 hash digest as a hex string.
+    """
+    return transcript(*chunks).hexdigest()
+
+
+def transcript(*chunks: bytes) -> hashlib.blake2b:
+    """
+    Start a blake2b_224 hasher primed with a fixed prefix.
+
+    The returned object can be `copy()`-ed and extended with `update()` so a
+    prefix shared by many digests is only compressed once.
+
+    Args:
+        *chunks (bytes): Byte strings absorbed in order.
+
+    Returns:
+        hashlib.blake2b: The primed hasher.
+    """
+    hasher = hashlib.blake2b(digest_size=28)
+    for chunk in chunks:
+        hasher.update(chunk)
+    return hasher
+
+
+def generate_branches(prefix: str, *tails: str) -> list[str]:
+    """
+    Calculates `generate(prefix + tail)` for each tail while absorbing the
+    shared prefix only once.
+
+    Args:
+        prefix (str): Hex string common to every digest.
+        *tails (str): Hex strings appended to the prefix, one per digest.
+
+    Returns:
+        list[str]: The blake2b_224 hash digests, in the order of `tails`.
+    """
+    state = transcript(binascii.unhexlify(prefix))
+    digests = []
+    for tail in tails:
+        branch = state.copy()
+        branch.update(binascii.unhexlify(tail))
+        digests.append(branch.hexdigest())
+    return digests
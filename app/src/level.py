@@ -1,6 +1,6 @@
 # Copyright (C) 2025 Logical Mechanism LLC
 # SPDX-License-Identifier: GPL-3.0-only
-from src.files import save_json
+from src.files import constr_bytes_json, constr_wrap_json, save_string
 
 
 def full_level_to_file(r1b: str, r2_g1b: str, r2_g2b: str, r4b: str) -> None:
@@ -28,29 +28,14 @@ def full_level_to_file(r1b: str, r2_g1b: str, r2_g2b: str, r4b: str) -> None:
         r4b: Hex/bytes string for the `r4` point (G1).
 
     Returns:
-        None. Writes the JSON artifact via `save_json`.
+        None. Writes the JSON artifact via `save_string`.
 
     Raises:
-        Any exceptions raised by `save_json` (e.g., invalid path or permissions)
+        Any exceptions raised by `save_string` (e.g., invalid path or permissions)
         will propagate.
     """
-    path = "../data/full-level.json"
-    data = {
-        "constructor": 0,
-        "fields": [
-            {
-                "constructor": 0,
-                "fields": [
-                    {"bytes": r1b},
-                    {"bytes": r2_g1b},
-                    {"bytes": r2_g2b},
-                    {"bytes": r4b},
-                ],
-            }
-        ],
-    }
-
-    save_json(path, data)
+    inner = constr_bytes_json(0, [r1b, r2_g1b, r2_g2b, r4b])
+    save_string("../data/full-level.json", constr_wrap_json(0, inner))
 
 
 def empty_full_level_to_file() -> None:
@@ -65,18 +50,13 @@ def empty_full_level_to_file() -> None:
         ../data/full-level.json
 
     Returns:
-        None. Writes the JSON artifact via `save_json`.
+        None. Writes the JSON artifact via `save_string`.
 
     Raises:
-        Any exceptions raised by `save_json` (e.g., invalid path or permissions)
+        Any exceptions raised by `save_string` (e.g., invalid path or permissions)
         will propagate.
     """
-    path = "../data/full-level.json"
-    data = {
-        "constructor": 1,
-        "fields": [],
-    }
-    save_json(path, data)
+    save_string("../data/full-level.json", constr_bytes_json(1, []))
 
 
 def half_level_to_file(r1b: str, r2_g1b: str, r4b: str) -> None:
@@ -103,19 +83,10 @@ def half_level_to_file(r1b: str, r2_g1b: str, r4b: str) -> None:
         r4b: Hex/bytes string for the `r4` point (G1).
 
     Returns:
-        None. Writes the JSON artifact via `save_json`.
+        None. Writes the JSON artifact via `save_string`.
 
     Raises:
-        Any exceptions raised by `save_json` (e.g., invalid path or permissions)
+        Any exceptions raised by `save_string` (e.g., invalid path or permissions)
         will propagate.
     """
-    path = "../data/half-level.json"
-    data = {
-        "constructor": 0,
-        "fields": [
-            {"bytes": r1b},
-            {"bytes": r2_g1b},
-            {"bytes": r4b},
-        ],
-    }
-    save_json(path, data)
+    save_string("../data/half-level.json", constr_bytes_json(0, [r1b, r2_g1b, r4b]))
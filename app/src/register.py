@@ -4,11 +4,11 @@
 # src/register.py
 
 from dataclasses import dataclass
-from src.bls12381 import g1_point, scale
-from src.files import save_json
+from src.bls12381 import g1_generator, g1_point, scale
+from src.files import constr_bytes_json, save_string
 
 
-@dataclass
+@dataclass(slots=True)
 class Register:
     """
     Public register for Schnorr-style proofs and transcript binding.
@@ -22,7 +22,7 @@ class Register:
 
     Construction modes:
     - Secret-known: provide `x`; the register derives:
-        g = g1_point(1)
+        g = g1_generator
         u = g1_point(x)
       (i.e., u is the canonical generator scaled by `x` using the helper.)
     - Public-only: provide both `g` and `u` with `x=None`.
@@ -50,7 +50,7 @@ class Register:
         """
         # Secret-known construction
         if self.x is not None:
-            self.g = g1_point(1)
+            self.g = g1_generator
             self.u = g1_point(self.x)
             return
 
@@ -68,7 +68,7 @@ class Register:
         """
         if not isinstance(other, Register):
             return NotImplemented
-        return self.x == other.x and self.g == other.g and self.u == other.u
+        return (self.x, self.g, self.u) == (other.x, other.g, other.u)
 
     def __mul__(self, other: object) -> str:
         """
@@ -134,21 +134,16 @@ class Register:
             ../data/register.json
 
         Returns:
-            None. Writes the JSON artifact via `save_json`.
+            None. Writes the JSON artifact via `save_string`.
 
         Raises:
-            Any exceptions raised by `save_json` (e.g., invalid path or permissions)
+            ValueError: If `g` or `u` was cleared to `None` after construction.
+            Any exceptions raised by `save_string` (e.g., invalid path or permissions)
             will propagate.
 
         Notes:
             This method writes `g` and `u` only. The secret `x` is never written.
         """
-        path = "../data/register.json"
-        data = {
-            "constructor": 0,
-            "fields": [
-                {"bytes": self.g},
-                {"bytes": self.u},
-            ],
-        }
-        save_json(path, data)
+        if self.g is None or self.u is None:
+            raise ValueError("Register (g, u) must be set to write it")
+        save_string("../data/register.json", constr_bytes_json(0, [self.g, self.u]))
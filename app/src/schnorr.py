@@ -3,11 +3,11 @@
 
 # src/schnorr.py
 
-from src.bls12381 import rng, scale, g1_point, to_int, from_int, curve_order
-from src.constants import SCH_DOMAIN_TAG
-from src.hashing import generate
+from src.bls12381 import rng, g1_point, to_int, from_int, curve_order
+from src.constants import SCH_DOMAIN_TAG_B
+from src.hashing import generate_b
 from src.register import Register
-from src.files import save_json
+from src.files import constr_bytes_json, save_string
 
 
 def fiat_shamir_heuristic(gb: str, grb: str, ub: str) -> str:
@@ -32,7 +32,7 @@ def fiat_shamir_heuristic(gb: str, grb: str, ub: str) -> str:
         A hex string digest (as returned by `generate`) that is typically mapped
         to a scalar via `to_int(...)`.
     """
-    return generate(SCH_DOMAIN_TAG + gb + grb + ub)
+    return generate_b(SCH_DOMAIN_TAG_B, bytes.fromhex(gb + grb + ub))
 
 
 def schnorr_proof(register: Register) -> tuple[str, str]:
@@ -65,7 +65,7 @@ def schnorr_proof(register: Register) -> tuple[str, str]:
         A tuple `(z_hex, grb)` where:
             z_hex: Response scalar `z` encoded as a minimal big-endian hex string
                 via `from_int`.
-            grb: Commitment point `[r]G` in the serialized format produced by `scale`.
+            grb: Commitment point `[r]G` in the serialized format produced by `g1_point`.
 
     Notes / assumptions:
         - This function treats missing fields defensively:
@@ -80,7 +80,7 @@ def schnorr_proof(register: Register) -> tuple[str, str]:
     u = register.u if register.u is not None else ""
     x = register.x if register.x is not None else 1
     r = rng()
-    grb = scale(g1_point(1), r)
+    grb = g1_point(r)
     c = to_int(fiat_shamir_heuristic(g, grb, u))
     z = (r + c * x) % curve_order
     return from_int(z), grb
@@ -107,18 +107,10 @@ def schnorr_to_file(z: str, grb: str) -> None:
         grb: Serialized commitment point `g^r` (G1 element encoding).
 
     Returns:
-        None. Writes the JSON artifact via `save_json`.
+        None. Writes the JSON artifact via `save_string`.
 
     Raises:
-        Any exceptions raised by `save_json` (e.g., invalid path or permissions)
+        Any exceptions raised by `save_string` (e.g., invalid path or permissions)
         will propagate.
     """
-    path = "../data/schnorr.json"
-    data = {
-        "constructor": 0,
-        "fields": [
-            {"bytes": z},
-            {"bytes": grb},
-        ],
-    }
-    save_json(path, data)
+    save_string("../data/schnorr.json", constr_bytes_json(0, [z, grb]))
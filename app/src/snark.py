@@ -3,22 +3,19 @@
 
 # snark.py
 
-import re
+import struct
 import subprocess
 from pathlib import Path
 from typing import Any, cast
 
 from src.files import load_json
+from src.bls12381 import combine, invert, multi_scale, pairing_check
 from eth_typing import BLSPubkey, BLSSignature
 from py_ecc.bls.g2_primitives import pubkey_to_G1, signature_to_G2
 from py_ecc.fields import optimized_bls12_381_FQ as FQ
 from py_ecc.optimized_bls12_381 import (
-    add,
     curve_order,
     field_modulus,
-    final_exponentiate,
-    multiply,
-    neg,
     pairing,
 )
 
@@ -397,21 +394,19 @@ def _expand_message_xmd(msg: bytes, dst: bytes, len_in_bytes: int) -> bytes:
     l_i_b_str = len_in_bytes.to_bytes(2, "big")
 
     # b_0 = H(Z_pad || msg || l_i_b_str || 0x00 || DST_prime)
-    h = hashlib.sha256()
-    h.update(z_pad + msg + l_i_b_str + bytes([0]) + dst_prime)
-    b_0 = h.digest()
+    b_0 = hashlib.sha256(z_pad + msg + l_i_b_str + bytes([0]) + dst_prime).digest()
 
     # b_1 = H(b_0 || 0x01 || DST_prime)
-    h = hashlib.sha256()
-    h.update(b_0 + bytes([1]) + dst_prime)
-    b_vals = [h.digest()]
+    b_vals = [hashlib.sha256(b_0 + bytes([1]) + dst_prime).digest()]
 
+    # strxor as one int XOR rather than a per-byte generator
+    b_0_int = int.from_bytes(b_0, "big")
     for i in range(2, ell + 1):
         # b_i = H(strxor(b_0, b_{i-1}) || i || DST_prime)
-        xored = bytes(a ^ b for a, b in zip(b_0, b_vals[-1]))
-        h = hashlib.sha256()
-        h.update(xored + bytes([i]) + dst_prime)
-        b_vals.append(h.digest())
+        xored = (b_0_int ^ int.from_bytes(b_vals[-1], "big")).to_bytes(
+            b_in_bytes, "big"
+        )
+        b_vals.append(hashlib.sha256(xored + bytes([i]) + dst_prime).digest())
 
     uniform_bytes = b"".join(b_vals)
     return uniform_bytes[:len_in_bytes]
@@ -467,12 +462,8 @@ def _solve_commitment_wire(
     Returns:
         The field element to append to the public witness
     """
-    # Get uncompressed commitment point bytes (x || y, each 48 bytes = 96 total)
-    x, y = _g1_jacobian_to_affine_xy_ints(commitment_point)
-    commitment_bytes = x.to_bytes(48, "big") + y.to_bytes(48, "big")
-
-    # Append committed public witness values
-    data = bytearray(commitment_bytes)
+    # Uncompressed commitment point bytes, then the committed public witnesses
+    data = bytearray(_g1_xy_bytes(commitment_point))
     for idx in committed_indices:
         # idx is 1-based, public_witness is 0-indexed
         w = public_witness[idx - 1]
@@ -485,13 +476,17 @@ def _solve_commitment_wire(
     return result[0]
 
 
-def _g1_uncompressed_bytes(g1_hex: str) -> bytes:
-    """Get uncompressed G1 point bytes (64 bytes: x || y)."""
-    p = _g1_from_compressed_hex(g1_hex)
+def _g1_xy_bytes(p) -> bytes:
+    """Encode a G1 point as uncompressed bytes (96 bytes: x || y, big-endian)."""
     x, y = _g1_jacobian_to_affine_xy_ints(p)
     return x.to_bytes(48, "big") + y.to_bytes(48, "big")
 
 
+def _g1_uncompressed_bytes(g1_hex: str) -> bytes:
+    """Get uncompressed G1 point bytes (96 bytes: x || y)."""
+    return _g1_xy_bytes(_g1_from_compressed_hex(g1_hex))
+
+
 def verify_snark_proof(out_dir: str | Path = "out", debug: bool = False) -> bool:
     """
     Verify a Groth16 proof using gnark's verification equation.
@@ -506,6 +501,10 @@ def verify_snark_proof(out_dir: str | Path = "out", debug: bool = False) -> bool
 
     This function is kept for reference and potential future use with py_ecc-native proofs.
 
+    The kSum multi-scalar multiplication and the pairing check go through
+    `src.bls12381`, so they run natively when the arkworks backend is active
+    and fall back to py_ecc otherwise.
+
     Equation: e(α, β) == e(A, B) * e(C, -δ) * e(kSum, -γ)
     Where kSum = IC[0] + Σ(pub[i] * IC[i+1]) + commitment_wires + Σ(D_i)
     """
@@ -519,25 +518,25 @@ def verify_snark_proof(out_dir: str | Path = "out", debug: bool = False) -> bool
     if not isinstance(inputs, list):
         raise TypeError("public.json: 'inputs' must be a list")
 
-    # Parse VK elements
-    alpha = _g1_from_compressed_hex(vk["vkAlpha"])
-    beta = _g2_from_compressed_hex(vk["vkBeta"])
-    gamma = _g2_from_compressed_hex(vk["vkGamma"])
-    delta = _g2_from_compressed_hex(vk["vkDelta"])
-    IC = [_g1_from_compressed_hex(p) for p in vk["vkIC"]]
+    # VK and proof points stay as compressed hex; the group operations and
+    # the pairing check below dispatch to the native backend when present
+    alpha = _g1_hex(vk["vkAlpha"])
+    beta = _g2_hex(vk["vkBeta"])
+    gamma = _g2_hex(vk["vkGamma"])
+    delta = _g2_hex(vk["vkDelta"])
+    IC = [_g1_hex(p) for p in vk["vkIC"]]
 
     # Parse commitment extension data
     commitment_keys = vk.get("commitmentKeys", [])
     public_and_commitment_committed = vk.get("publicAndCommitmentCommitted", [])
 
     # Parse proof elements
-    A = _g1_from_compressed_hex(proof["piA"])
-    B = _g2_from_compressed_hex(proof["piB"])
-    C = _g1_from_compressed_hex(proof["piC"])
+    A = _g1_hex(proof["piA"])
+    B = _g2_hex(proof["piB"])
+    C = _g1_hex(proof["piC"])
 
     # Parse commitment points from proof
-    commitment_hexes = proof.get("commitments", [])
-    commitments = [_g1_from_compressed_hex(h) for h in commitment_hexes]
+    commitments = [_g1_hex(h) for h in proof.get("commitments", [])]
 
     if debug:
         print("\n=== gnark-style Groth16 Verification ===")
@@ -548,16 +547,8 @@ def verify_snark_proof(out_dir: str | Path = "out", debug: bool = False) -> bool
         print(f"  public_and_commitment_committed: {public_and_commitment_committed}")
 
     # Build public witness vector (as integers)
-    # Try both with and without "1" to see which works
-    # inputs[0] is "1" (gnark convention)
+    # inputs[0] is "1" (gnark convention); gnark's witness omits it
     public_witness_no_one = [int(s) for s in inputs[1:]]
-    public_witness_with_one = [int(s) for s in inputs]
-
-    if debug:
-        print(f"  public_witness without '1': {len(public_witness_no_one)} elements")
-        print(f"  public_witness with '1': {len(public_witness_with_one)} elements")
-
-    # Use the version without "1" (gnark's actual witness format)
     public_witness = public_witness_no_one.copy()
 
     # gnark's verification with commitments:
@@ -568,20 +559,12 @@ def verify_snark_proof(out_dir: str | Path = "out", debug: bool = False) -> bool
     # 4. Add commitment points to kSum
     # 5. Verify pairing equation
 
-    num_commitments = len(commitments)
-
-    if debug:
-        print(f"  num_public_inputs (original): {len(public_witness)}")
-        print(f"  num_commitments: {num_commitments}")
-        print(f"  len(IC): {len(IC)}")
-        print(f"  public_and_commitment_committed: {public_and_commitment_committed}")
-
     # Step 1-2: For each commitment, compute and append the commitment wire
     for i, D in enumerate(commitments):
         if i < len(public_and_commitment_committed):
             committed_indices = public_and_commitment_committed[i]
             commitment_wire = _solve_commitment_wire(
-                D, committed_indices, public_witness_no_one
+                _g1_from_compressed_hex(D), committed_indices, public_witness_no_one
             )
             public_witness.append(commitment_wire)
             if debug:
@@ -590,79 +573,32 @@ def verify_snark_proof(out_dir: str | Path = "out", debug: bool = False) -> bool
     if debug:
         print(f"  Extended public_witness length: {len(public_witness)}")
 
-    # Step 3: Compute kSum = IC[0] + Σ(public_witness[i] * IC[i+1])
-    # gnark uses: kSum.MultiExp(K[1:], publicWitness, ...)
-    # where publicWitness now includes the commitment wires
-
-    kSum = IC[0]
-
-    # Use all available public witness elements with corresponding IC points
-    for i in range(len(public_witness)):
-        if i + 1 < len(IC):
-            term = multiply(IC[i + 1], public_witness[i])
-            kSum = add(kSum, term)
+    # Step 3-4: kSum = IC[0] + Σ(public_witness[i] * IC[i+1]) + Σ(D_i)
+    # gnark uses kSum.MultiExp(K[1:], publicWitness, ...), with the
+    # commitment wires included in publicWitness
+    kSum = _linear_combination(IC, public_witness)
+    for D in commitments:
+        kSum = combine(kSum, D)
 
     if debug:
-        print(
-            f"  Used {min(len(public_witness), len(IC) - 1)} witness elements for IC multiplication"
-        )
-
-    # Step 4: Add all commitment points Σ(D_i)
-    for i, D in enumerate(commitments):
-        kSum = add(kSum, D)
-        if debug:
-            print(f"  Added commitment[{i}] to kSum")
-
-    if debug:
-        kSum_x, kSum_y = _g1_jacobian_to_affine_xy_ints(kSum)
+        kSum_x, kSum_y = _g1_uncompress_to_xy_ints(kSum)
         print("  kSum computed:")
         print(f"    x: {kSum_x}")
         print(f"    y: {kSum_y}")
 
-    # Negate gamma and delta for the pairing equation
-    # Use py_ecc's neg function directly
-    gamma_neg = neg(gamma)
-    delta_neg = neg(delta)
-
     # gnark's verification equation:
-    # vk.e == FinalExp(e(A, B) * e(C, -δ) * e(kSum, -γ))
-    # where vk.e = e(α, β)
-    #
-    # Equivalently: e(α, β) == e(A, B) * e(C, -δ) * e(kSum, -γ)
-
-    # gnark's verification equation (product form):
-    # e(A, B) * e(C, -δ) * e(kSum, -γ) * e(-α, β) == 1
-    #
-    # This is equivalent to: e(α, β) == e(A, B) * e(C, -δ) * e(kSum, -γ)
-
-    # Compute pairings
-    e_A_B = pairing(B, A, final_exponentiate=False)
-    e_C_deltaNeg = pairing(delta_neg, C, final_exponentiate=False)
-    e_kSum_gammaNeg = pairing(gamma_neg, kSum, final_exponentiate=False)
-    e_alpha_beta = pairing(beta, alpha, final_exponentiate=False)
-
-    # Product form: all pairings multiplied together should equal 1
-    # e(A,B) * e(C,-δ) * e(kSum,-γ) == e(α,β)
-    # => e(A,B) * e(C,-δ) * e(kSum,-γ) * e(α,β)^{-1} == 1
-    product = e_A_B * e_C_deltaNeg * e_kSum_gammaNeg
-    left_final = final_exponentiate(e_alpha_beta)
-    right_final = final_exponentiate(product)
-
-    result = left_final == right_final
+    #   e(α, β) == e(A, B) * e(C, -δ) * e(kSum, -γ)
+    # checked in product form with a single final exponentiation:
+    #   e(A, B) * e(C, -δ) * e(kSum, -γ) * e(-α, β) == 1
+    gamma_neg = invert(gamma)
+    delta_neg = invert(delta)
+    alpha_neg = invert(alpha)
+
+    result = pairing_check([A, C, kSum, alpha_neg], [B, delta_neg, gamma_neg, beta])
 
     if debug:
-        print("\n  Pairings computed:")
-        print("    e(A, B)")
-        print("    e(C, -δ)")
-        print("    e(kSum, -γ)")
-        print("    e(α, β)")
         print(f"  Verification result: {result}")
 
-    # Also try alternative formulation: negate alpha instead of gamma/delta
-    if not result and debug:
-        print("\n  --- Trying alternative: negate alpha ---")
-        print("  Alternative product final exp computed")
-
     if result:
         if debug:
             print("\n✓ Verification succeeded (gnark equation)")
@@ -673,17 +609,11 @@ def verify_snark_proof(out_dir: str | Path = "out", debug: bool = False) -> bool
         print("\n--- Trying without commitment extension ---")
 
     # Simple vk_x = IC[0] + Σ(inputs[i] * IC[i+1])
-    inputs_int = [int(s) for s in inputs]
-    vk_x = IC[0]
-    for i, s in enumerate(inputs_int):
-        if i + 1 < len(IC):
-            vk_x = add(vk_x, multiply(IC[i + 1], s))
+    vk_x = _linear_combination(IC, [int(s) for s in inputs])
 
-    e_vkx_gammaNeg = pairing(gamma_neg, vk_x, final_exponentiate=False)
-    right_simple = e_A_B * e_C_deltaNeg * e_vkx_gammaNeg
-    right_simple_final = final_exponentiate(right_simple)
-
-    result_simple = left_final == right_simple_final
+    result_simple = pairing_check(
+        [A, C, vk_x, alpha_neg], [B, delta_neg, gamma_neg, beta]
+    )
 
     if debug:
         print(f"  Simple verification result: {result_simple}")
@@ -698,36 +628,74 @@ def verify_snark_proof(out_dir: str | Path = "out", debug: bool = False) -> bool
     return False
 
 
+def _g1_hex(h: str) -> str:
+    """Normalize a compressed G1 hex string, checking it is 48 bytes."""
+    raw = _hex_to_bytes(h)
+    if len(raw) != 48:
+        raise ValueError(f"G1 compressed must be 48 bytes, got {len(raw)}")
+    return raw.hex()
+
+
+def _g2_hex(h: str) -> str:
+    """Normalize a compressed G2 hex string, checking it is 96 bytes."""
+    raw = _hex_to_bytes(h)
+    if len(raw) != 96:
+        raise ValueError(f"G2 compressed must be 96 bytes, got {len(raw)}")
+    return raw.hex()
+
+
+def _linear_combination(IC: list[str], witness: list[int]) -> str:
+    """
+    Compute IC[0] + Σ(witness[i] * IC[i+1]) over the IC points available.
+
+    Witness entries beyond the IC points are ignored, matching gnark.
+    """
+    n = min(len(witness), len(IC) - 1)
+    if n == 0:
+        return IC[0]
+    return combine(IC[0], multi_scale(IC[1 : n + 1], witness[:n]))
+
+
 # ----------------------------
 # Public integer extraction (if you still need it)
 # Use the SAME decoding path (pubkey_to_G1) so coordinates align with gnark.
 # ----------------------------
 
-_LIMB_BITS = 64
 _NB_LIMBS_FP = 6
-_LIMB_MASK = (1 << _LIMB_BITS) - 1
+# an Fp element read as 6 little-endian 64-bit limbs
+_FP_LIMBS = struct.Struct(f"<{_NB_LIMBS_FP}Q")
 
 
-def _strip_0x_and_validate_g1_hex(h: str) -> str:
-    """Strip optional '0x' prefix and validate that `h` is 96 hex chars (48 bytes)."""
-    h = h.strip().lower()
-    if h.startswith("0x"):
+def _decode_g1_hex(h: str) -> bytes:
+    """Strip optional '0x' prefix and decode `h`, which must be 96 hex chars (48 bytes)."""
+    h = h.strip()
+    if h[:2] in ("0x", "0X"):
         h = h[2:]
-    if not re.fullmatch(r"[0-9a-f]+", h or ""):
+    try:
+        raw = bytes.fromhex(h)
+    except ValueError:
+        raise ValueError("invalid hex string") from None
+    # fromhex skips embedded whitespace, so an empty or spaced string decodes short
+    if not raw or 2 * len(raw) != len(h):
         raise ValueError("invalid hex string")
-    if len(h) != 96:
+    if len(raw) != 48:
         raise ValueError(
             f"compressed G1 must be 48 bytes (96 hex chars), got {len(h)} hex chars"
         )
-    return h
+    return raw
+
+
+def _strip_0x_and_validate_g1_hex(h: str) -> str:
+    """Strip optional '0x' prefix and validate that `h` is 96 hex chars (48 bytes)."""
+    return _decode_g1_hex(h).hex()
 
 
 def _fq_inv_nonrecursive(z: FQ) -> FQ:
-    """Compute the modular inverse of an FQ element using Fermat's little theorem."""
+    """Compute the modular inverse of an FQ element (extended Euclid via `pow`)."""
     zi = int(z) % field_modulus
     if zi == 0:
         raise ZeroDivisionError("inverse of zero in Fp")
-    return FQ(pow(zi, field_modulus - 2, field_modulus))
+    return FQ(pow(zi, -1, field_modulus))
 
 
 def _g1_jacobian_to_affine_xy_ints(p) -> tuple[int, int]:
@@ -748,18 +716,13 @@ def _g1_jacobian_to_affine_xy_ints(p) -> tuple[int, int]:
 
 def _g1_uncompress_to_xy_ints(g1_hex: str) -> tuple[int, int]:
     """Decompress a G1 hex string and return affine `(x, y)` as integers."""
-    g1_hex = _strip_0x_and_validate_g1_hex(g1_hex)
-    p = pubkey_to_G1(cast(BLSPubkey, bytes.fromhex(g1_hex)))
+    p = pubkey_to_G1(cast(BLSPubkey, _decode_g1_hex(g1_hex)))
     return _g1_jacobian_to_affine_xy_ints(p)
 
 
 def _fp_to_limbs_le(x: int) -> list[int]:
     """Split an Fp integer into 6 little-endian 64-bit limbs."""
-    limbs: list[int] = []
-    for _ in range(_NB_LIMBS_FP):
-        limbs.append(x & _LIMB_MASK)
-        x >>= _LIMB_BITS
-    return limbs
+    return list(_FP_LIMBS.unpack(x.to_bytes(_FP_LIMBS.size, "little")))
 
 
 def public_inputs_from_w0_w1_hex(w0_hex: str, w1_hex: str, v_hex: str) -> list[str]:
@@ -3,8 +3,12 @@
 
 # tests/test_binding.py
 
+import json
+
 import pytest
 
+from src.constants import BND_DOMAIN_TAG
+from src.hashing import generate
 from src.register import Register
 from src.bls12381 import (
     to_int,
@@ -15,7 +19,12 @@ from src.bls12381 import (
     curve_order,
 )
 import src.binding as binding_mod
-from src.binding import binding_proof, fiat_shamir_heuristic, binding_to_file
+from src.binding import (
+    binding_proof,
+    binding_proofs_batch,
+    fiat_shamir_heuristic,
+    binding_to_file,
+)
 
 
 @pytest.mark.parametrize(
@@ -94,6 +103,24 @@ def test_fiat_shamir_none_g_u_equivalent_to_empty_string_transcript():
     assert h_none == h_empty
 
 
+@pytest.mark.parametrize(
+    "g, u, fields",
+    [
+        ("aa", "bb", ("c", "cd", "dee", "f0", "")),
+        ("a", "bbb", ("cc", "d", "d", "ee", "ff")),
+        ("a", "bb", ("c", "dd", "ee", "ff", "00")),
+    ],
+)
+def test_fiat_shamir_decodes_joined_transcript(g: str, u: str, fields):
+    """
+    Fields are hex fragments of one transcript: only the joined string has to
+    be whole bytes, as when it was hashed in one `generate` call.
+    """
+    reg = Register.from_public(g, u)
+    expected = generate(BND_DOMAIN_TAG + g + u + "".join(fields))
+    assert fiat_shamir_heuristic(reg, *fields) == expected
+
+
 @pytest.mark.parametrize(
     "token_name",
     ["acab", "context-A".encode().hex(), "context-B".encode().hex()],
@@ -242,14 +269,51 @@ def test_binding_proof_outputs_are_mod_curve_order(monkeypatch):
     assert 0 <= zrb_i < curve_order
 
 
+@pytest.mark.parametrize("count", [1, 3])
+def test_binding_proofs_batch_verifies_each_proof(count: int):
+    user = Register(x=rng())
+    assert user.x is not None
+    assert user.u is not None
+    token_name = "acab"
+
+    items = []
+    for i in range(count):
+        a, r = rng(), rng()
+        x = (a + user.x * r) % curve_order
+        items.append((a, r, scale(g1_point(1), r), scale(g1_point(1), x)))
+
+    proofs = binding_proofs_batch(items, user, token_name, max_workers=2)
+    assert len(proofs) == count
+
+    for (_a, _r, r1b, r2b), (zab, zrb, t1b, t2b) in zip(items, proofs):
+        c = to_int(fiat_shamir_heuristic(user, t1b, t2b, r1b, r2b, token_name))
+        assert scale(g1_point(1), to_int(zrb)) == combine(t1b, scale(r1b, c))
+        assert combine(
+            scale(g1_point(1), to_int(zab)), scale(user.u, to_int(zrb))
+        ) == combine(t2b, scale(r2b, c))
+
+
+@pytest.mark.parametrize("u", [None, ""])
+def test_binding_proof_treats_missing_u_as_identity(monkeypatch, u):
+    draws = iter([11, 13])
+    monkeypatch.setattr(binding_mod, "rng", lambda: next(draws))
+
+    user = Register(x=5)
+    user.u = u
+    _zab, _zrb, t1b, t2b = binding_proof(3, 4, g1_point(4), g1_point(8), user, "acab")
+
+    assert t1b == g1_point(11)
+    assert t2b == g1_point(13)
+
+
 def test_binding_to_file_writes_expected_schema(monkeypatch):
     captured = {}
 
-    def fake_save_json(path, data):
+    def fake_save_string(path, string):
         captured["path"] = path
-        captured["data"] = data
+        captured["data"] = json.loads(string)
 
-    monkeypatch.setattr(binding_mod, "save_json", fake_save_json)
+    monkeypatch.setattr(binding_mod, "save_string", fake_save_string)
 
     zab = "aa"
     zrb = "bb"
@@ -270,11 +334,11 @@ def test_binding_to_file_writes_expected_schema(monkeypatch):
     }
 
 
-def test_binding_to_file_propagates_save_json_errors(monkeypatch):
+def test_binding_to_file_propagates_save_string_errors(monkeypatch):
     def boom(*_args, **_kwargs):
         raise RuntimeError("disk full")
 
-    monkeypatch.setattr(binding_mod, "save_json", boom)
+    monkeypatch.setattr(binding_mod, "save_string", boom)
 
     with pytest.raises(RuntimeError, match="disk full"):
         binding_to_file("aa", "bb", "cc", "dd")
@@ -5,9 +5,12 @@
 
 import pytest
 
-from src.constants import H0, F12_DOMAIN_TAG
+import src.bls12381 as bls_mod
+from src.constants import H0, H1, H2, H3, F12_DOMAIN_TAG
 from src.hashing import generate
 from src.bls12381 import (
+    g1_generator,
+    g2_generator,
     g1_identity,
     g1_point,
     g2_identity,
@@ -20,10 +23,29 @@ from src.bls12381 import (
     fq12_encoding,
     to_int,
     from_int,
+    from_scalar,
     invert,
     rng,
     random_fq12,
     curve_order,
+    fixed_base_multiply,
+    g1_point_b,
+    scale_b,
+    combine_b,
+    uncompress_b,
+    multi_scale,
+    h0_negated,
+    final_exponentiation,
+    conjugate,
+    pairing_check,
+)
+from py_ecc.optimized_bls12_381 import (
+    FQ12,
+    G1,
+    final_exponentiate,
+    multiply,
+    normalize,
+    pairing,
 )
 
 
@@ -33,6 +55,12 @@ def test_rng_range_and_nonzero():
         assert 1 <= x < curve_order
 
 
+def test_rng_rejects_out_of_range_draws(monkeypatch):
+    draws = iter([b"\xff" * 32, b"\x00" * 32, (10).to_bytes(32, "big")])
+    monkeypatch.setattr("src.bls12381.os.urandom", lambda _n: next(draws))
+    assert rng() == 5
+
+
 def test_g1_identity():
     g0 = g1_point(0)
     assert g0 == g1_identity
@@ -43,6 +71,91 @@ def test_g2_identity():
     assert g0 == g2_identity
 
 
+def test_generator_constants_and_scale_fast_path():
+    assert g1_point(1) == g1_generator
+    assert g2_point(1) == g2_generator
+
+    # scaling a generator skips decompression but must agree with point addition
+    assert scale(g1_generator, 5) == combine(g1_point(2), g1_point(3))
+    assert scale(g2_generator, 5) == combine(g2_point(2), g2_point(3))
+
+
+@pytest.fixture()
+def py_ecc_backend(monkeypatch):
+    # the native backend would take these calls before the fixed-base and
+    # Pippenger paths run, so pin them to py_ecc
+    monkeypatch.setattr(bls_mod, "_native", None)
+
+
+@pytest.mark.parametrize(
+    "scalar", [0, 1, 15, 16, 0xDEADBEEF, curve_order - 1, curve_order + 3]
+)
+def test_fixed_base_multiply_matches_double_and_add(scalar: int):
+    expected = normalize(multiply(G1, scalar % curve_order))
+    assert normalize(fixed_base_multiply(g1_generator, scalar)) == expected
+
+
+def test_fixed_base_multiply_rejects_other_points():
+    with pytest.raises(ValueError, match="FIXED_BASES"):
+        fixed_base_multiply(g1_point(5), 3)
+
+
+def test_byte_api_matches_hex_api():
+    p = g1_point_b(42)
+    assert p.hex() == g1_point(42)
+    assert scale_b(p, 3).hex() == scale(g1_point(42), 3)
+    assert combine_b(p, g1_point_b(7)).hex() == g1_point(49)
+
+    h = bytes.fromhex(H0)
+    assert scale_b(h, 5).hex() == scale(H0, 5)
+    assert combine_b(h, h).hex() == scale(H0, 2)
+
+
+def test_uncompress_is_cached_per_encoding():
+    p = g1_point(1234)
+    uncompress(p)
+    hits = uncompress_b.cache_info().hits
+    assert uncompress(p) == uncompress_b(bytes.fromhex(p))
+    assert uncompress_b.cache_info().hits == hits + 2
+
+
+@pytest.mark.parametrize("n", [1, 2, 5, 40])
+def test_multi_scale_matches_scale_and_combine(py_ecc_backend, n: int):
+    points = [g1_point(3 * i + 1) for i in range(n)]
+    scalars = [curve_order - 7 * i - 1 for i in range(n)]
+    expected = scale(points[0], scalars[0])
+    for p, k in zip(points[1:], scalars[1:]):
+        expected = combine(expected, scale(p, k))
+    assert multi_scale(points, scalars) == expected
+
+
+@pytest.mark.parametrize("base", [H0, H1, H2, H3])
+def test_fixed_base_scale_matches_double_and_add(py_ecc_backend, base: str):
+    for scalar in [2, 0xDEADBEEF, curve_order - 1]:
+        expected = compress(multiply(uncompress(base), scalar))
+        assert scale(base, scalar) == expected
+
+
+def test_h0_negated_constant():
+    assert h0_negated == invert(H0)
+    assert combine(H0, h0_negated) == g2_identity
+
+
+def test_multi_scale_over_fixed_bases(py_ecc_backend):
+    expected = combine(combine(scale(H1, 3), scale(H2, 5)), scale(H3, 7))
+    assert multi_scale([H1, H2, H3], [3, 5, 7]) == expected
+    assert multi_scale([H1, g2_point(9)], [3, 5]) == combine(scale(H1, 3), g2_point(45))
+
+
+def test_multi_scale_g2_and_input_validation():
+    assert multi_scale([H0, g2_point(2)], [3, 5]) == combine(scale(H0, 3), g2_point(10))
+    assert multi_scale([g1_point(2)], [0]) == g1_identity
+    with pytest.raises(ValueError):
+        multi_scale([], [])
+    with pytest.raises(ValueError):
+        multi_scale([g1_point(2)], [1, 2])
+
+
 def test_uncompress_branch_selection_by_length():
     g1 = g1_point(1)
     g2 = g2_point(1)
@@ -177,6 +290,28 @@ def test_pair_final_exponentiate_flag_does_not_break_type_or_determinism():
     assert c is not None
 
 
+@pytest.mark.parametrize("g2_element", [H0, g2_point(11)])
+def test_pair_precomputed_lines_match_py_ecc(g2_element: str):
+    g1 = g1_point(123456)
+    q, p = uncompress(g2_element), uncompress(g1)
+    assert pair(g1, g2_element, final_exponentiate=False) == pairing(q, p, False)
+    assert pair(g1, g2_element) == pairing(q, p)
+    assert pair(g1_identity, g2_element) == pair(g1, g2_identity)
+
+
+def test_final_exponentiation_matches_py_ecc():
+    miller = pair(g1_point(5), g2_point(9), final_exponentiate=False)
+    for value in [miller, miller * miller + miller, FQ12.one()]:
+        assert final_exponentiation(value) == final_exponentiate(value)
+
+
+def test_conjugate_inverts_pairing_outputs():
+    a = pair(g1_point(31), g2_point(7))
+    b = pair(g1_point(7), g2_point(7))
+    assert a * conjugate(b) == a / b
+    assert b * conjugate(b) == FQ12.one()
+
+
 def test_dividing_pairing():
     u1g1 = g1_point(1)
     v1g2 = g2_point(1)
@@ -189,6 +324,20 @@ def test_dividing_pairing():
     assert c == d
 
 
+@pytest.mark.parametrize("native", [False, True])
+def test_pairing_check_product_form(monkeypatch, native: bool):
+    if not native:
+        monkeypatch.setattr(bls_mod, "_native", None)
+    elif bls_mod._native is None:
+        pytest.skip("native backend not installed")
+
+    # e([3]G1, [5]G2) * e([-15]G1, G2) == 1
+    g1s = [g1_point(3), invert(g1_point(15))]
+    g2s = [g2_point(5), g2_generator]
+    assert pairing_check(g1s, g2s) is True
+    assert pairing_check([g1_point(3), invert(g1_point(14))], g2s) is False
+
+
 def test_fq12_encoding_domain_tag_changes_output():
     u1g1 = g1_point(1)
     v1g2 = g2_point(1)
@@ -224,6 +373,13 @@ def test_from_int_encodes_minimal_and_zero_special_case():
         assert int(from_int(v), 16) == v
 
 
+def test_from_scalar_is_fixed_width():
+    assert from_scalar(0) == "00" * 32
+    assert from_scalar(256) == "00" * 30 + "0100"
+    assert to_int(from_scalar(curve_order - 1)) == curve_order - 1
+    assert len(from_scalar(curve_order - 1)) == 64
+
+
 def test_random_fq12_is_deterministic_given_scalar():
     a = 424242
     assert random_fq12(a) == random_fq12(a)
@@ -3,8 +3,22 @@
 
 # tests/test_commands.py
 
+import pytest
 
 import src.commands as commands_mod
+from src.ecies import reset_aesgcm_cache
+
+
+@pytest.fixture(autouse=True)
+def _clear_command_caches():
+    # each test mocks extract_key/to_int differently for the same wallet paths
+    commands_mod._key_secret.cache_clear()
+    commands_mod._secret_public.cache_clear()
+    reset_aesgcm_cache()
+    yield
+    commands_mod._key_secret.cache_clear()
+    commands_mod._secret_public.cache_clear()
+    reset_aesgcm_cache()
 
 
 class DummyRegister:
@@ -29,12 +43,6 @@ def _setup_common_mocks(monkeypatch):
     calls = []
 
     # ---- light stubs for algebra / encoding
-    def fake_g1_point(n: int) -> str:
-        return f"G1({n})"
-
-    def fake_g2_point(n: int) -> str:
-        return f"G2({n})"
-
     def fake_scale(elem: str, scalar: int) -> str:
         out = f"scale({elem},{scalar})"
         calls.append(("scale", elem, scalar, out))
@@ -45,9 +53,9 @@ def _setup_common_mocks(monkeypatch):
         calls.append(("combine", a, b, out))
         return out
 
-    def fake_invert(elem: str) -> str:
-        out = f"invert({elem})"
-        calls.append(("invert", elem, out))
+    def fake_multi_scale(elems: list[str], scalars: list[int]) -> str:
+        out = f"multi_scale({','.join(elems)};{scalars})"
+        calls.append(("multi_scale", elems, scalars, out))
         return out
 
     # ---- deterministic "hash" and "to_int" mapping
@@ -61,6 +69,9 @@ def _setup_common_mocks(monkeypatch):
         calls.append(("generate", msg, out))
         return out
 
+    def fake_generate_branches(prefix: str, *tails: str) -> list[str]:
+        return [fake_generate(prefix + tail) for tail in tails]
+
     def fake_to_int(digest: str) -> int:
         calls.append(("to_int", digest))
         if digest in to_int_map:
@@ -105,6 +116,9 @@ def _setup_common_mocks(monkeypatch):
     ) -> None:
         calls.append(("full_level_to_file", old_r1b, old_r2_g1b, r5b, old_r4b))
 
+    def fake_empty_full_level_to_file() -> None:
+        calls.append(("empty_full_level_to_file",))
+
     def fake_encrypt(r1b: str, m0: str, payload: bytes) -> tuple[str, str, str]:
         calls.append(("encrypt", r1b, m0, payload))
         return ("nonce", "aad", "ct")
@@ -135,13 +149,15 @@ def _setup_common_mocks(monkeypatch):
     # ---- patch into src.commands module namespace
     monkeypatch.setattr(commands_mod, "Register", DummyRegister)
 
-    monkeypatch.setattr(commands_mod, "g1_point", fake_g1_point)
-    monkeypatch.setattr(commands_mod, "g2_point", fake_g2_point)
+    monkeypatch.setattr(commands_mod, "g1_generator", "G1(1)")
+    monkeypatch.setattr(commands_mod, "g2_generator", "G2(1)")
+    monkeypatch.setattr(commands_mod, "h0_negated", "NEG_H0")
     monkeypatch.setattr(commands_mod, "scale", fake_scale)
     monkeypatch.setattr(commands_mod, "combine", fake_combine)
-    monkeypatch.setattr(commands_mod, "invert", fake_invert)
+    monkeypatch.setattr(commands_mod, "multi_scale", fake_multi_scale)
 
     monkeypatch.setattr(commands_mod, "generate", fake_generate)
+    monkeypatch.setattr(commands_mod, "generate_branches", fake_generate_branches)
     monkeypatch.setattr(commands_mod, "to_int", fake_to_int)
     monkeypatch.setattr(commands_mod, "rng", fake_rng)
 
@@ -154,6 +170,9 @@ def _setup_common_mocks(monkeypatch):
 
     monkeypatch.setattr(commands_mod, "half_level_to_file", fake_half_level_to_file)
     monkeypatch.setattr(commands_mod, "full_level_to_file", fake_full_level_to_file)
+    monkeypatch.setattr(
+        commands_mod, "empty_full_level_to_file", fake_empty_full_level_to_file
+    )
 
     monkeypatch.setattr(commands_mod, "encrypt", fake_encrypt)
     monkeypatch.setattr(commands_mod, "capsule_to_file", fake_capsule_to_file)
@@ -198,6 +217,13 @@ def test_create_snark_tx_happy_path(monkeypatch):
 
     monkeypatch.setattr(commands_mod, "generate_snark_proof", fake_generate_snark_proof)
 
+    def fake_convert_all(proof_path, public_path, datum_path) -> None:
+        calls.append(
+            ("convert_all", str(proof_path), str(public_path), str(datum_path))
+        )
+
+    monkeypatch.setattr(commands_mod, "convert_all", fake_convert_all)
+
     # rng: a0=11, r0=22
     set_to_int("GT(11)", 9)  # hk = to_int(m0)
 
@@ -230,6 +256,8 @@ def test_create_snark_tx_happy_path(monkeypatch):
     assert str(out_p).endswith("/out")
     assert str(setup_p).endswith("/circuit")
 
+    assert len(_calls_of(calls, "convert_all")) == 1
+
 
 def test_create_encryption_tx_happy_path(monkeypatch):
     calls, set_to_int = _setup_common_mocks(monkeypatch)
@@ -265,7 +293,15 @@ def test_create_encryption_tx_happy_path(monkeypatch):
     _, r1b, r2b, r4b = half_calls[0]
     assert r1b == expected_r1b
     assert r2b == expected_r2
-    assert isinstance(r4b, str) and r4b.startswith("scale(")
+    assert len(_calls_of(calls, "empty_full_level_to_file")) == 1
+
+    # r4 = [22]([3]H1 + [5]H2 + H3) mod 97
+    msm_calls = _calls_of(calls, "multi_scale")
+    assert len(msm_calls) == 1
+    _, elems, scalars, out = msm_calls[0]
+    assert elems == [commands_mod.H1, commands_mod.H2, commands_mod.H3]
+    assert scalars == [66, 13, 22]
+    assert r4b == out
 
     assert ("encrypt", expected_r1b, "GT(11)", b"hello") in calls
     assert ("capsule_to_file", "nonce", "aad", "ct") in calls
@@ -279,6 +315,40 @@ def test_create_encryption_tx_happy_path(monkeypatch):
     assert ("binding_to_file", "zab", "zrb", "t1b", "t2b") in calls
 
 
+def test_create_encryption_tx_snark_failure_writes_nothing(monkeypatch):
+    calls, _ = _setup_common_mocks(monkeypatch)
+
+    def failing_gt_to_hash(a: int, snark_path) -> str:
+        raise RuntimeError("snark failed")
+
+    monkeypatch.setattr(commands_mod, "gt_to_hash", failing_gt_to_hash)
+
+    with pytest.raises(RuntimeError, match="snark failed"):
+        commands_mod.create_encryption_tx("alice_wallet", b"PAYLOAD", "TOKEN")
+
+    for name in (
+        "schnorr_to_file",
+        "half_level_to_file",
+        "empty_full_level_to_file",
+        "capsule_to_file",
+        "binding_to_file",
+    ):
+        assert not _calls_of(calls, name)
+
+
+def test_secret_register_is_fresh_per_call(monkeypatch):
+    calls, _ = _setup_common_mocks(monkeypatch)
+
+    first = commands_mod._secret_register(7)
+    second = commands_mod._secret_register(7)
+
+    assert first is not second
+    assert (first.x, first.g, first.u) == (7, "G1(1)", "scale(G1(1),7)")
+    assert (second.x, second.g, second.u) == (first.x, first.g, first.u)
+    # u = [sk]G1 is computed once per secret
+    assert len(_calls_of(calls, "scale")) == 1
+
+
 def test_create_bidding_tx_happy_path(monkeypatch):
     calls, set_to_int = _setup_common_mocks(monkeypatch)
 
@@ -292,6 +362,12 @@ def test_create_bidding_tx_happy_path(monkeypatch):
 
     assert not _calls_of(calls, "half_level_to_file")
     assert not _calls_of(calls, "capsule_to_file")
+
+    # a second command for the same wallet key reuses the derived secret
+    commands_mod.create_bidding_tx("bob_wallet")
+    assert calls.count(("extract_key", "bob_wallet")) == 2
+    assert calls.count(("to_int", sk_digest)) == 1
+    assert calls.count(("schnorr_to_file", "zb", "grb")) == 2
     assert not _calls_of(calls, "binding_to_file")
 
 
@@ -348,7 +424,14 @@ def test_create_reencryption_tx_happy_path(monkeypatch):
     _, r1b, r2b, r4b = half_calls[0]
     assert r1b == expected_r1b
     assert r2b == expected_r2
-    assert isinstance(r4b, str) and r4b.startswith("scale(")
+
+    # r4 = [22]([4]H1 + [6]H2) mod 97
+    msm_calls = _calls_of(calls, "multi_scale")
+    assert len(msm_calls) == 1
+    _, elems, scalars, out = msm_calls[0]
+    assert elems == [commands_mod.H1, commands_mod.H2]
+    assert scalars == [88, 35]
+    assert r4b == out
 
     assert any(c[0] == "save_string" and c[1] == "../data/r5.point" for c in calls)
     assert any(
@@ -372,7 +455,7 @@ def test_create_reencryption_tx_happy_path(monkeypatch):
     assert old_r1 == "OLD_R1"
     assert old_r2 == "OLD_R2_G1"
     assert old_r4 == "OLD_R4"
-    assert isinstance(r5b, str) and r5b.startswith("combine(")
+    assert r5b == "combine(scale(G2(1),9),scale(NEG_H0,13))"
 
 
 def test_recursive_decrypt_walks_entries_and_prints(monkeypatch, capsys):
@@ -5,12 +5,13 @@
 
 import binascii
 import hashlib
+import json
 
 import pytest
 from cryptography.exceptions import InvalidTag
 
 import src.ecies as ecies_mod
-from src.ecies import capsule_to_file, decrypt, encrypt
+from src.ecies import capsule_to_file, decrypt, encrypt, reset_aesgcm_cache
 
 
 @pytest.fixture(autouse=True)
@@ -29,6 +30,10 @@ def patch_generate_to_even_hex(monkeypatch):
         return hashlib.sha256(s.encode("utf-8")).hexdigest()
 
     monkeypatch.setattr(ecies_mod, "generate", gen)
+    # ciphers are cached per (context, kem); tests swap generate()
+    reset_aesgcm_cache()
+    yield
+    reset_aesgcm_cache()
 
 
 @pytest.fixture()
@@ -60,6 +65,16 @@ def test_encrypt_decrypt_roundtrip_bytes(fixed_urandom):
     assert pt == msg
 
 
+def test_encrypt_accepts_bytes_like_buffers(fixed_urandom):
+    msg = b"canonical cbor payload"
+    ctx = "acab"
+    kem = "cafe" * 16
+
+    expected = encrypt(ctx, kem, msg)
+    assert encrypt(ctx, kem, bytearray(msg)) == expected
+    assert encrypt(ctx, kem, memoryview(msg)) == expected
+
+
 def test_encrypt_decrypt_roundtrip_empty_message(fixed_urandom):
     msg = b""
     ctx = "ctx"
@@ -79,6 +94,7 @@ def test_encrypt_is_deterministic_with_fixed_nonce_and_inputs(
     monkeypatch.setattr(
         ecies_mod, "generate", lambda _s: ("ab" * 32)
     )  # even-length hex
+    reset_aesgcm_cache()
 
     ctx = "same"
     kem = "11" * 32
@@ -131,6 +147,14 @@ def test_decrypt_fails_with_wrong_context(fixed_urandom):
         decrypt("ctx-B", kem, nonce, ct, aad)
 
 
+def test_cipher_is_reused_for_same_context_and_kem(fixed_urandom):
+    kem = "cafe" * 16
+    nonce, aad, ct = encrypt("acab", kem, b"hello")
+    hits = ecies_mod._cipher.cache_info().hits
+    assert decrypt("acab", kem, nonce, ct, aad) == b"hello"
+    assert ecies_mod._cipher.cache_info().hits == hits + 1
+
+
 def test_decrypt_fails_with_wrong_kem(fixed_urandom):
     msg = b"hello"
     ctx = "acab"
@@ -200,11 +224,11 @@ def test_encrypt_raises_if_generate_returns_odd_length_aad(monkeypatch, fixed_ur
 def test_capsule_to_file_writes_expected_schema(monkeypatch):
     captured = {}
 
-    def fake_save_json(path, data):
+    def fake_save_string(path, string):
         captured["path"] = path
-        captured["data"] = data
+        captured["data"] = json.loads(string)
 
-    monkeypatch.setattr(ecies_mod, "save_json", fake_save_json)
+    monkeypatch.setattr(ecies_mod, "save_string", fake_save_string)
 
     nonce = "00" * 12
     aad = "aa" * 16
@@ -223,11 +247,11 @@ def test_capsule_to_file_writes_expected_schema(monkeypatch):
     }
 
 
-def test_capsule_to_file_propagates_save_json_errors(monkeypatch):
+def test_capsule_to_file_propagates_save_string_errors(monkeypatch):
     def boom(*_args, **_kwargs):
         raise RuntimeError("no perms")
 
-    monkeypatch.setattr(ecies_mod, "save_json", boom)
+    monkeypatch.setattr(ecies_mod, "save_string", boom)
 
     with pytest.raises(RuntimeError, match="no perms"):
         capsule_to_file("00" * 12, "aa", "bb")
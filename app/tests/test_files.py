@@ -4,11 +4,20 @@
 # tests/test_files.py
 
 import json
+import os
 from pathlib import Path
 
 import pytest
 
-from src.files import extract_key, load_json, save_json, save_string
+from src.files import (
+    constr_bytes_json,
+    constr_wrap_json,
+    extract_key,
+    invalidate_key_cache,
+    load_json,
+    save_json,
+    save_string,
+)
 
 
 def test_save_string_creates_parent_dirs_and_writes_utf8(tmp_path: Path):
@@ -116,6 +125,33 @@ def test_extract_key_non_string_cborhex_raises_typeerror(tmp_path: Path):
         extract_key(str(key_file))
 
 
+def test_extract_key_rereads_file_when_mtime_changes(tmp_path: Path):
+    key_file = tmp_path / "payment.skey"
+    key_file.write_text(json.dumps({"cborHex": "5820aa"}), encoding="utf-8")
+    os.utime(key_file, ns=(1, 1))
+    assert extract_key(str(key_file)) == "aa"
+
+    # same mtime hits the cache even though the contents changed
+    key_file.write_text(json.dumps({"cborHex": "5820bb"}), encoding="utf-8")
+    os.utime(key_file, ns=(1, 1))
+    assert extract_key(str(key_file)) == "aa"
+
+    os.utime(key_file, ns=(2, 2))
+    assert extract_key(str(key_file)) == "bb"
+
+
+def test_invalidate_key_cache_forces_reread(tmp_path: Path):
+    key_file = tmp_path / "payment.skey"
+    key_file.write_text(json.dumps({"cborHex": "5820aa"}), encoding="utf-8")
+    os.utime(key_file, ns=(1, 1))
+    assert extract_key(str(key_file)) == "aa"
+
+    key_file.write_text(json.dumps({"cborHex": "5820bb"}), encoding="utf-8")
+    os.utime(key_file, ns=(1, 1))
+    invalidate_key_cache()
+    assert extract_key(str(key_file)) == "bb"
+
+
 def test_load_json_missing_file_raises(tmp_path: Path):
     with pytest.raises(FileNotFoundError):
         load_json(tmp_path / "nope.json")
@@ -128,9 +164,38 @@ def test_load_json_invalid_json_raises(tmp_path: Path):
         load_json(p)
 
 
+def test_load_json_preserves_big_integers(tmp_path: Path):
+    # Plutus "int" fields and gnark vk/proof limbs exceed 64 bits; a parser
+    # that silently turns them into floats would corrupt datums
+    big = 2**255 + 19
+    p = tmp_path / "datum.json"
+    p.write_text(
+        f'{{"constructor": 0, "fields": [{{"int": {big}}}]}}', encoding="utf-8"
+    )
+    assert load_json(p)["fields"][0]["int"] == big
+
+
 def test_cbor_strip_reference():
     cbor_hex = "5820c26ab1dfd790169240824cf9b70be778f42b0287f28e16a528384cbaf4045acb"
     assert (
         cbor_hex[4:]
         == "c26ab1dfd790169240824cf9b70be778f42b0287f28e16a528384cbaf4045acb"
     )
+
+
+@pytest.mark.parametrize("fields", [[], ["aa"], ["aa", "bb", "cc" * 48, "dd"]])
+def test_constr_bytes_json_matches_save_json(tmp_path: Path, fields: list[str]):
+    out = tmp_path / "constr.json"
+    save_json(out, {"constructor": 3, "fields": [{"bytes": f} for f in fields]})
+    assert constr_bytes_json(3, fields) == out.read_text(encoding="utf-8")
+
+
+@pytest.mark.parametrize("fields", [[], ["aa", "bb", "cc" * 96, "dd"]])
+def test_constr_wrap_json_matches_save_json(tmp_path: Path, fields: list[str]):
+    out = tmp_path / "nested.json"
+    inner = {"constructor": 2, "fields": [{"bytes": f} for f in fields]}
+    save_json(
+        out, {"constructor": 0, "fields": [{"constructor": 1, "fields": [inner]}]}
+    )
+    text = constr_wrap_json(0, constr_wrap_json(1, constr_bytes_json(2, fields)))
+    assert text == out.read_text(encoding="utf-8")
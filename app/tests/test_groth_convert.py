@@ -7,6 +7,7 @@ import json
 from pathlib import Path
 
 
+import src.groth_convert as groth_convert_mod
 from src.groth_convert import (
     convert_all,
     convert_commitment_wires_file,
@@ -289,6 +290,36 @@ class TestFileConversion:
             wires_result = json.load(f)
         assert len(wires_result["list"]) == 1
 
+    def test_convert_all_matches_single_file_conversions(
+        self, tmp_path: Path, monkeypatch
+    ):
+        """convert_all parses public.json once and writes the same files."""
+        proof_path = tmp_path / "proof.json"
+        public_path = tmp_path / "public.json"
+        proof_path.write_text(json.dumps(SAMPLE_GNARK_PROOF))
+        public_path.write_text(json.dumps(SAMPLE_GNARK_PUBLIC))
+
+        convert_public_file(public_path, tmp_path / "public-single.json")
+        convert_commitment_wires_file(public_path, tmp_path / "wires-single.json")
+
+        reads = []
+        read_json = groth_convert_mod._read_json
+
+        def counting_read_json(path):
+            reads.append(Path(path).name)
+            return read_json(path)
+
+        monkeypatch.setattr(groth_convert_mod, "_read_json", counting_read_json)
+        convert_all(proof_path, public_path, tmp_path / "out")
+
+        assert reads == ["proof.json", "public.json"]
+        assert (tmp_path / "out" / "groth-public.json").read_text() == (
+            tmp_path / "public-single.json"
+        ).read_text()
+        assert (tmp_path / "out" / "groth-commitment-wires.json").read_text() == (
+            tmp_path / "wires-single.json"
+        ).read_text()
+
 
 class TestRoundTrip:
     """Test that converted output matches expected Aiken format."""
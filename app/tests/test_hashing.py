@@ -6,7 +6,12 @@
 import binascii
 import pytest
 
-from src.hashing import generate
+from src.hashing import (
+    generate,
+    generate_b,
+    generate_branches,
+    transcript,
+)
 
 
 def test_empty_string_hash_matches_known_vector():
@@ -58,3 +63,26 @@ def test_distinct_inputs_produce_distinct_digests_probabilistic_sanity():
     assert h1 != h2
     assert h1 != h3
     assert h2 != h3
+
+
+def test_bytes_digest_matches_hex_digest():
+    assert generate_b(b"\xac", b"\xab") == generate("acab")
+    assert generate_b() == generate("")
+
+
+def test_transcript_prefix_can_be_copied_and_extended():
+    prefix = transcript(b"\xac")
+    a = prefix.copy()
+    a.update(b"\xab")
+    b = prefix.copy()
+    b.update(b"\x00")
+    assert a.hexdigest() == generate("acab")
+    assert b.hexdigest() == generate("ac00")
+    assert prefix.hexdigest() == generate("ac")
+
+
+def test_branches_match_independent_digests():
+    prefix = "acab" * 20
+    tails = ["", "00", "deadbeef" * 30]
+    assert generate_branches(prefix, *tails) == [generate(prefix + t) for t in tails]
+    assert generate_branches(prefix) == []
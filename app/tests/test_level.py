@@ -3,18 +3,21 @@
 
 # tests/test_level.py
 
+import json
+
 import src.level as level_mod
+from src.files import save_json
 from src.level import full_level_to_file, empty_full_level_to_file, half_level_to_file
 
 
 def test_full_level_to_file_writes_correct_structure(monkeypatch):
     captured = {}
 
-    def fake_save_json(path, data):
+    def fake_save_string(path, string):
         captured["path"] = path
-        captured["data"] = data
+        captured["data"] = json.loads(string)
 
-    monkeypatch.setattr(level_mod, "save_json", fake_save_json)
+    monkeypatch.setattr(level_mod, "save_string", fake_save_string)
 
     full_level_to_file("r1_hex", "r2g1_hex", "r2g2_hex", "r4_hex")
 
@@ -32,14 +35,28 @@ def test_full_level_to_file_writes_correct_structure(monkeypatch):
     assert inner["fields"][3] == {"bytes": "r4_hex"}
 
 
+def test_level_templates_match_save_json(monkeypatch, tmp_path):
+    written = {}
+    monkeypatch.setattr(
+        level_mod, "save_string", lambda path, string: written.update({path: string})
+    )
+    full_level_to_file("aa" * 48, "bb" * 48, "cc" * 96, "dd" * 48)
+    half_level_to_file("aa" * 48, "bb" * 48, "dd" * 48)
+
+    for path, string in written.items():
+        out = tmp_path / "level.json"
+        save_json(out, json.loads(string))
+        assert string == out.read_text(encoding="utf-8"), path
+
+
 def test_empty_full_level_to_file_writes_empty_variant(monkeypatch):
     captured = {}
 
-    def fake_save_json(path, data):
+    def fake_save_string(path, string):
         captured["path"] = path
-        captured["data"] = data
+        captured["data"] = json.loads(string)
 
-    monkeypatch.setattr(level_mod, "save_json", fake_save_json)
+    monkeypatch.setattr(level_mod, "save_string", fake_save_string)
 
     empty_full_level_to_file()
 
@@ -52,11 +69,11 @@ def test_empty_full_level_to_file_writes_empty_variant(monkeypatch):
 def test_half_level_to_file_writes_correct_structure(monkeypatch):
     captured = {}
 
-    def fake_save_json(path, data):
+    def fake_save_string(path, string):
         captured["path"] = path
-        captured["data"] = data
+        captured["data"] = json.loads(string)
 
-    monkeypatch.setattr(level_mod, "save_json", fake_save_json)
+    monkeypatch.setattr(level_mod, "save_string", fake_save_string)
 
     half_level_to_file("r1_hex", "r2g1_hex", "r4_hex")
 
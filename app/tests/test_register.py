@@ -3,6 +3,8 @@
 
 # tests/test_register.py
 
+import json
+
 import pytest
 
 import src.register as register_mod
@@ -28,6 +30,7 @@ def stub_group_ops(monkeypatch):
 
     monkeypatch.setattr(register_mod, "g1_point", fake_g1_point)
     monkeypatch.setattr(register_mod, "scale", fake_scale)
+    monkeypatch.setattr(register_mod, "g1_generator", "G1(1)")
     return calls
 
 
@@ -37,8 +40,8 @@ def test_secret_known_construction_derives_g_and_u(stub_group_ops):
     assert alice.g == "G1(1)"
     assert alice.u == "G1(123)"
 
-    # Verify helper calls
-    assert ("g1_point", 1, "G1(1)") in stub_group_ops
+    # Verify helper calls; g is the generator constant, not a scalar mul
+    assert ("g1_point", 1, "G1(1)") not in stub_group_ops
     assert ("g1_point", 123, "G1(123)") in stub_group_ops
 
 
@@ -101,11 +104,11 @@ def test_mul_returns_notimplemented_if_u_is_none(stub_group_ops):
 def test_to_file_writes_expected_schema(monkeypatch, stub_group_ops):
     captured = {}
 
-    def fake_save_json(path, data):
+    def fake_save_string(path, string):
         captured["path"] = path
-        captured["data"] = data
+        captured["data"] = json.loads(string)
 
-    monkeypatch.setattr(register_mod, "save_json", fake_save_json)
+    monkeypatch.setattr(register_mod, "save_string", fake_save_string)
 
     r = Register(x=9)
     r.to_file()
@@ -120,17 +123,28 @@ def test_to_file_writes_expected_schema(monkeypatch, stub_group_ops):
     }
 
 
-def test_to_file_propagates_save_json_errors(monkeypatch, stub_group_ops):
+def test_to_file_propagates_save_string_errors(monkeypatch, stub_group_ops):
     def boom(*_args, **_kwargs):
         raise RuntimeError("disk full")
 
-    monkeypatch.setattr(register_mod, "save_json", boom)
+    monkeypatch.setattr(register_mod, "save_string", boom)
 
     r = Register(x=1)
     with pytest.raises(RuntimeError, match="disk full"):
         r.to_file()
 
 
+def test_to_file_rejects_cleared_fields(monkeypatch, stub_group_ops):
+    writes = []
+    monkeypatch.setattr(register_mod, "save_string", lambda *a: writes.append(a))
+
+    r = Register.from_public("G", "U")
+    r.u = None
+    with pytest.raises(ValueError, match="must be set"):
+        r.to_file()
+    assert writes == []
+
+
 def test_shared_secret_commutes_under_stub_scale(stub_group_ops):
     """
     Under the stub model:
@@ -3,9 +3,13 @@
 
 # tests/test_schnorr.py
 
+import json
+
 import pytest
 
 import src.schnorr as schnorr_mod
+from src.constants import SCH_DOMAIN_TAG
+from src.hashing import generate
 from src.schnorr import fiat_shamir_heuristic, schnorr_proof, schnorr_to_file
 
 
@@ -69,6 +73,12 @@ def test_fiat_shamir_is_deterministic():
     assert isinstance(h1, str)
 
 
+def test_fiat_shamir_decodes_joined_transcript():
+    # only the joined transcript has to be whole bytes, as with one generate()
+    expected = generate(SCH_DOMAIN_TAG + "a" + "bcd" + "ef")
+    assert fiat_shamir_heuristic("a", "bcd", "ef") == expected
+
+
 def test_fiat_shamir_changes_when_any_field_changes():
     g = "G".encode().hex()
     gr = "GR".encode().hex()
@@ -96,7 +106,6 @@ def test_schnorr_proof_uses_rng_once_and_is_deterministic_with_fixed_rng(monkeyp
 
     # Also patch group ops to avoid heavy crypto in this unit-level behavior test.
     monkeypatch.setattr(schnorr_mod, "g1_point", lambda n: f"G1({n})")
-    monkeypatch.setattr(schnorr_mod, "scale", lambda e, s: f"scale({e},{s})")
     monkeypatch.setattr(schnorr_mod, "to_int", lambda _h: 7)
     monkeypatch.setattr(schnorr_mod, "from_int", lambda n: f"hex({n})")
     monkeypatch.setattr(schnorr_mod, "curve_order", 97)
@@ -120,7 +129,7 @@ def test_schnorr_proof_uses_rng_once_and_is_deterministic_with_fixed_rng(monkeyp
     assert out1 == out2
 
     z_hex, grb = out1
-    assert grb == "scale(G1(1),42)"
+    assert grb == "G1(42)"
     # z = (r + c*x) % q = (42 + 7*3) % 97 = 63
     assert z_hex == "hex(63)"
 
@@ -131,7 +140,6 @@ def test_schnorr_proof_default_x_is_one_when_missing(monkeypatch):
     """
     monkeypatch.setattr(schnorr_mod, "rng", lambda: 10)
     monkeypatch.setattr(schnorr_mod, "g1_point", lambda n: f"G1({n})")
-    monkeypatch.setattr(schnorr_mod, "scale", lambda e, s: f"scale({e},{s})")
     monkeypatch.setattr(schnorr_mod, "to_int", lambda _h: 5)
     monkeypatch.setattr(schnorr_mod, "from_int", lambda n: f"hex({n})")
     monkeypatch.setattr(schnorr_mod, "curve_order", 97)
@@ -146,7 +154,7 @@ def test_schnorr_proof_default_x_is_one_when_missing(monkeypatch):
     reg = R(x=None, g="G", u="U")
     z_hex, grb = schnorr_proof(reg)  # type: ignore[arg-type]
 
-    assert grb == "scale(G1(1),10)"
+    assert grb == "G1(10)"
     # z = (r + c*1) % 97 = 15
     assert z_hex == "hex(15)"
 
@@ -164,8 +172,7 @@ def test_schnorr_proof_substitutes_empty_string_for_missing_g_or_u(monkeypatch):
         return "H"
 
     monkeypatch.setattr(schnorr_mod, "rng", lambda: 1)
-    monkeypatch.setattr(schnorr_mod, "g1_point", lambda n: "G1(1)")
-    monkeypatch.setattr(schnorr_mod, "scale", lambda e, s: "GR")
+    monkeypatch.setattr(schnorr_mod, "g1_point", lambda n: "GR")
     monkeypatch.setattr(schnorr_mod, "to_int", lambda _h: 0)
     monkeypatch.setattr(schnorr_mod, "from_int", lambda n: "00")
     monkeypatch.setattr(schnorr_mod, "curve_order", 97)
@@ -187,11 +194,11 @@ def test_schnorr_proof_substitutes_empty_string_for_missing_g_or_u(monkeypatch):
 def test_schnorr_to_file_writes_expected_schema(monkeypatch):
     captured = {}
 
-    def fake_save_json(path, data):
+    def fake_save_string(path, string):
         captured["path"] = path
-        captured["data"] = data
+        captured["data"] = json.loads(string)
 
-    monkeypatch.setattr(schnorr_mod, "save_json", fake_save_json)
+    monkeypatch.setattr(schnorr_mod, "save_string", fake_save_string)
 
     schnorr_to_file("aa", "bb")
 
@@ -205,11 +212,11 @@ def test_schnorr_to_file_writes_expected_schema(monkeypatch):
     }
 
 
-def test_schnorr_to_file_propagates_save_json_errors(monkeypatch):
+def test_schnorr_to_file_propagates_save_string_errors(monkeypatch):
     def boom(*_args, **_kwargs):
         raise RuntimeError("disk full")
 
-    monkeypatch.setattr(schnorr_mod, "save_json", boom)
+    monkeypatch.setattr(schnorr_mod, "save_string", boom)
 
     with pytest.raises(RuntimeError, match="disk full"):
         schnorr_to_file("aa", "bb")
@@ -3,6 +3,7 @@
 
 # tests/test_snark.py
 
+import json
 import os
 from typing import Any, cast
 
@@ -485,6 +486,24 @@ class TestExpandMessageXmd:
         b_val = _expand_message_xmd(b"msg2", b"DST", 32)
         assert a != b_val
 
+    @pytest.mark.parametrize(
+        "msg, expected",
+        [
+            (
+                b"",
+                "68a985b87eb6b46952128911f2a4412bbc302a9d759667f87f7a21d803f07235",
+            ),
+            (
+                b"abc",
+                "d8ccab23b5985ccea865c6c97b6e5b8350e794e603b4b97902f53a8a0d605615",
+            ),
+        ],
+    )
+    def test_rfc9380_vectors(self, msg, expected):
+        # RFC 9380 K.1, expand_message_xmd(SHA-256), len_in_bytes = 0x20
+        dst = b"QUUX-V01-CS02-with-expander-SHA256-128"
+        assert _expand_message_xmd(msg, dst, 32).hex() == expected
+
 
 class TestHashToFieldGnark:
     def test_single_element(self):
@@ -513,6 +532,12 @@ class TestSolveCommitmentWire:
         assert isinstance(result, int)
         assert 0 <= result < curve_order
 
+    def test_hashes_uncompressed_point_and_committed_inputs(self):
+        g1 = _g1_from_compressed_hex(G1_HEX)
+        data = _g1_uncompressed_bytes(G1_HEX) + (7).to_bytes(32, "big")
+        expected = _hash_to_field_gnark(data, b"BSB22-Groth16-Fiat-Shamir", 1)[0]
+        assert _solve_commitment_wire(g1, [2], [42, 7]) == expected
+
 
 class TestG1UncompressedBytes:
     def test_returns_96_bytes(self):
@@ -538,6 +563,14 @@ class TestStripAndValidateG1Hex:
         with pytest.raises(ValueError, match="96 hex chars"):
             _strip_0x_and_validate_g1_hex("aabb")
 
+    def test_uppercase_is_normalized(self):
+        assert _strip_0x_and_validate_g1_hex("0X" + G1_HEX.upper()) == G1_HEX.lower()
+
+    @pytest.mark.parametrize("bad", ["", "0x", G1_HEX[:48] + " " + G1_HEX[49:]])
+    def test_empty_or_embedded_whitespace_is_invalid(self, bad):
+        with pytest.raises(ValueError, match="invalid hex"):
+            _strip_0x_and_validate_g1_hex(bad)
+
 
 class TestFqInvNonrecursive:
     def test_inverse(self):
@@ -590,6 +623,12 @@ class TestFpToLimbsLe:
         assert result[1] == 1
         assert len(result) == 6
 
+    def test_field_modulus_minus_one_recombines(self):
+        val = field_modulus - 1
+        result = _fp_to_limbs_le(val)
+        assert sum(limb << (64 * i) for i, limb in enumerate(result)) == val
+        assert all(0 <= limb < 1 << 64 for limb in result)
+
 
 class TestSetupSnark:
     def test_setup_calls_subprocess(self, monkeypatch):
@@ -658,6 +697,35 @@ class TestVerifySnarkProof:
         # We don't assert True because py_ecc is known incompatible with gnark.
         assert isinstance(result, bool)
 
+    @staticmethod
+    def _write_synthetic_proof(out_dir, tamper: bool = False) -> None:
+        """Write a commitment-free Groth16 instance built from known scalars."""
+        a, b_, g, d, ic0, ic1, x, s_, t = 3, 5, 7, 11, 13, 17, 19, 23, 29
+        k = (ic0 + x * ic1) % curve_order
+        # s*t = a*b + k*g + c*d  (mod r)
+        c = (s_ * t - a * b_ - k * g) * pow(d, -1, curve_order) % curve_order
+        if tamper:
+            c = (c + 1) % curve_order
+        vk = {
+            "vkAlpha": g1_point(a),
+            "vkBeta": g2_point(b_),
+            "vkGamma": g2_point(g),
+            "vkDelta": g2_point(d),
+            "vkIC": [g1_point(ic0), g1_point(ic1)],
+        }
+        proof = {"piA": g1_point(s_), "piB": g2_point(t), "piC": g1_point(c)}
+        public = {"inputs": ["1", str(x)]}
+        for name, data in (("vk", vk), ("proof", proof), ("public", public)):
+            (out_dir / f"{name}.json").write_text(json.dumps(data))
+
+    def test_accepts_valid_synthetic_proof(self, tmp_path):
+        self._write_synthetic_proof(tmp_path)
+        assert verify_snark_proof(tmp_path) is True
+
+    def test_rejects_tampered_synthetic_proof(self, tmp_path):
+        self._write_synthetic_proof(tmp_path, tamper=True)
+        assert verify_snark_proof(tmp_path) is False
+
 
 if __name__ == "__main__":
     pytest.main()